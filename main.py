@@ -35,7 +35,7 @@ def main():
         
         # 4. Bulk Download
         logger.info("Step 4: Starting bulk download of transcripts...")
-        results = downloader.bulk_download(hierarchy, output_dir)
+        results = downloader.bulk_download(hierarchy, output_dir, concurrency=5)
         
         # 5. Generate Report
         logger.info("Step 5: Generating summary report...")
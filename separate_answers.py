@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 """Separate inline answers from questions in all chapters"""
 
+import contextlib
+import io
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def separate_answers_in_chapter(chapter_path):
+# Answer lines of the form **תשובה:** [X], optionally followed by an explanation line
+_ANSWER_RE = re.compile(r'\*\*תשובה:\*\*\s*\[([א-ת]|[a-dA-D])\](?:\s*\n\*\([^\)]+\)\*)?')
+
+# Runs of excessive blank lines
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+# Single-pass cleanup: a whitespace run holding answer lines (group 1 is set),
+# or a run of excessive blank lines
+_CLEANUP_RE = re.compile(r'\s*(?:' + _ANSWER_RE.pattern + r'\s*)+|' + _BLANK_LINES_RE.pattern)
+
+def _clean_match(m):
+    """Replacement for _CLEANUP_RE: drop the answers, then collapse blank lines, as two passes would"""
+    if m.group(1) is None:
+        return "\n\n"
+    # Only whitespace is left once the answers are gone
+    return _BLANK_LINES_RE.sub("\n\n", _ANSWER_RE.sub("", m.group()))
+
+def separate_answers_in_chapter(chapter_path, content=None):
     """Separate answers from questions and create answer key at end"""
-    content = chapter_path.read_text(encoding='utf-8')
+    if content is None:
+        content = chapter_path.read_bytes().decode('utf-8')
 
     # Find all question section headers
     section_pattern = r'##\s*שאלות לתרגול'
@@ -24,11 +45,7 @@ def separate_answers_in_chapter(chapter_path):
     before_questions = content[:last_section_start]
 
     # Find all answers with pattern **תשובה:** [X]
-    answer_pattern = r'\*\*תשובה:\*\*\s*\[([א-ת]|[a-dA-D])\](?:\s*\n\*\([^\)]+\)\*)?'
-    answers = []
-
-    for match in re.finditer(answer_pattern, questions_and_answers):
-        answers.append(match.group(1))
+    answers = _ANSWER_RE.findall(questions_and_answers)
 
     if not answers:
         print(f"  No answers found in {chapter_path.name}")
@@ -36,11 +53,8 @@ def separate_answers_in_chapter(chapter_path):
 
     print(f"  Found {len(answers)} answers")
 
-    # Remove all answer lines from questions section
-    questions_clean = re.sub(answer_pattern, '', questions_and_answers)
-
-    # Clean up excessive blank lines
-    questions_clean = re.sub(r'\n\s*\n\s*\n+', '\n\n', questions_clean)
+    # Remove all answer lines and collapse excessive blank lines in one pass
+    questions_clean = _CLEANUP_RE.sub(_clean_match, questions_and_answers)
 
     # Build answer key
     answer_key = "\n\n---\n\n*תשובות בעמוד הבא – נסו לענות בעצמכם קודם!*\n\n\\newpage\n\n## מפתח תשובות\n\n"
@@ -53,13 +67,30 @@ def separate_answers_in_chapter(chapter_path):
 
     return new_content
 
+def process_one(path_str):
+    """Read, transform and write back a single chapter (runs in a worker process)
+
+    Returns the chapter's log text instead of printing it, so the parent can
+    print each chapter's lines together.
+    """
+    chapter_file = Path(path_str)
+    with contextlib.redirect_stdout(io.StringIO()) as log:
+        print(f"Processing {chapter_file.name}...")
+        content = chapter_file.read_bytes().decode('utf-8')
+        new_content = separate_answers_in_chapter(chapter_file, content)
+        if new_content != content:
+            chapter_file.write_bytes(new_content.encode('utf-8'))
+            print(f"  ✓ Updated {chapter_file.name}\n")
+        else:
+            print(f"  = Unchanged {chapter_file.name}\n")
+    return log.getvalue()
+
 if __name__ == "__main__":
     chapters_dir = Path("book/chapters")
 
-    for chapter_file in sorted(chapters_dir.glob("*.md")):
-        print(f"Processing {chapter_file.name}...")
-        new_content = separate_answers_in_chapter(chapter_file)
-        chapter_file.write_text(new_content, encoding='utf-8')
-        print("  ✓ Completed\n")
+    # One worker per chapter; map keeps the logs in sorted file order
+    with ProcessPoolExecutor() as ex:
+        for log in ex.map(process_one, [str(p) for p in sorted(chapters_dir.glob("*.md"))]):
+            print(log, end="")
 
     print("✅ All chapters processed!")
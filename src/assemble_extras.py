@@ -8,6 +8,9 @@ FRONT_MATTER_FILE = BOOK_DIR / "00_front_matter.md"
 QUESTION_BANK_FILE = BOOK_DIR / "92_question_bank.md"
 EXAM_REVIEW_FILE = BOOK_DIR / "91_exam_review.md"
 
+# "## שאלות לתרגול" section body, up to the next level-2 heading or EOF
+_QUESTIONS_RE = re.compile(r"## שאלות לתרגול\n(.*?)(?=^## |\Z)", re.DOTALL | re.MULTILINE)
+
 def generate_front_matter():
     content = """# וירוסים: איך מנצחים אותם?
 
@@ -32,8 +35,7 @@ def generate_front_matter():
 
 \\newpage
 """
-    with open(FRONT_MATTER_FILE, 'w', encoding='utf-8') as f:
-        f.write(content)
+    FRONT_MATTER_FILE.write_bytes(content.encode('utf-8'))
     print(f"Wrote {FRONT_MATTER_FILE}")
 
 def aggregate_questions():
@@ -46,30 +48,25 @@ def aggregate_questions():
     all_questions = []
 
     for f in files:
-        with open(f, 'r', encoding='utf-8') as fh:
-            text = fh.read()
-        
-        # Regex to find "## שאלות לתרגול" and content until next ## or EOF
-        match = re.search(r"## שאלות לתרגול\n(.*?)(?=\n## |\Z)", text, re.DOTALL)
+        text = f.read_bytes().decode('utf-8')
+
+        match = _QUESTIONS_RE.search(text)
         if match:
             questions = match.group(1).strip()
-            chapter_title = " ".join(f.stem.split("_")[1:])
+            chapter_title = f.stem.partition("_")[2].replace("_", " ")
             all_questions.append(f"## שאלות מתוך {chapter_title}\n\n{questions}\n")
             
-    with open(QUESTION_BANK_FILE, 'w', encoding='utf-8') as f:
-        f.write("# בנק שאלות (Question Bank)\n\n")
-        f.write("ריכוז שאלות התרגול מכל פרקי הספר.\n\n")
-        for q in all_questions:
-            f.write(q + "\n---\n\n")
-            
+    parts = ["# בנק שאלות (Question Bank)\n\n", "ריכוז שאלות התרגול מכל פרקי הספר.\n\n"]
+    parts.extend(q + "\n---\n\n" for q in all_questions)
+    QUESTION_BANK_FILE.write_bytes("".join(parts).encode('utf-8'))
+
     print(f"Wrote {QUESTION_BANK_FILE}")
 
 def main():
     generate_front_matter()
     aggregate_questions()
     # Exam review could be generated similarly or using claims
-    with open(EXAM_REVIEW_FILE, 'w', encoding='utf-8') as f:
-        f.write("# חזרה למבחן (Exam Review)\n\n*(תוכן זה נוצר אוטומטית)*\n")
+    EXAM_REVIEW_FILE.write_bytes("# חזרה למבחן (Exam Review)\n\n*(תוכן זה נוצר אוטומטית)*\n".encode('utf-8'))
     print(f"Wrote stub for {EXAM_REVIEW_FILE}")
 
 if __name__ == "__main__":
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Parsed claims.jsonl, cached in an mtime-keyed pickle shared by plan.py and write_book.py"""
+
+import os
+import pickle
+from pathlib import Path
+
+import orjson
+
+CACHE_FILE = Path("ops/artifacts/claims.pkl")
+
+def load(jsonl_path, cache_path=CACHE_FILE):
+    """Return the parsed claims from jsonl_path, each tagged with its claim_id.
+
+    Reads the cache_path pickle when it is at least as new as the JSONL;
+    otherwise parses the JSONL and rewrites the pickle.
+    """
+    if cache_path.exists() and cache_path.stat().st_mtime >= jsonl_path.stat().st_mtime:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    claims = []
+    # Parse raw bytes; blank lines still count towards the claim_id numbering
+    for i, line in enumerate(jsonl_path.read_bytes().split(b"\n")):
+        if not line:
+            continue
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            # Line number gives the stable ID that plan.py and write_book.py share
+            data["claim_id"] = f"claim_{i:05d}"
+            claims.append(data)
+
+    tmp_path = cache_path.with_suffix(".pkl.tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(claims, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return claims
@@ -6,6 +6,6 @@ class Config(BaseSettings):
     PASSWORD: str = Field(alias="CAMPUS_IL_PASSWORD")
     COURSE_URL: str = Field(alias="COURSE_URL")
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True)
 
 config = Config()
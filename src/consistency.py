@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
-import json
+from collections import defaultdict
 from pathlib import Path
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 ENTITIES_FILE = Path("ops/artifacts/entities.jsonl")
 TERMINOLOGY_FILE = Path("ops/artifacts/terminology.yml")
 GLOSSARY_FILE = Path("book/90_glossary.md")
@@ -13,19 +19,21 @@ def main():
         return
         
     entities = []
-    with open(ENTITIES_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            try:
-                entities.append(json.loads(line))
-            except:
-                pass
-                
+    for line in ENTITIES_FILE.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            entities.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+
     print(f"Loaded {len(entities)} entity mentions.")
     
     # Consolidate by Hebrew term
     # normalization: lowercase, strip
     
-    consolidated = {}
+    consolidated = defaultdict(lambda: {"term_english": set(), "best_def": ""})
+    consolidated_get = consolidated.__getitem__
     
     for e in entities:
         term = e.get("term_hebrew", "").strip()
@@ -33,52 +41,39 @@ def main():
             continue
         
         norm_term = term # In Hebrew usually casing doesn't matter much but helpful for consistency
-        
-        if norm_term not in consolidated:
-            consolidated[norm_term] = {
-                "term_hebrew": term,
-                "term_english": set(),
-                "definitions": []
-            }
+        slot = consolidated_get(norm_term)
         
         eng = e.get("term_english")
         if eng:
-            consolidated[norm_term]["term_english"].add(eng)
+            slot["term_english"].add(eng)
         
+        # Keep the best definition as we go (longest? most frequent?)
+        # For now: longest
         definition = e.get("definition")
-        if definition:
-            consolidated[norm_term]["definitions"].append(definition)
+        if definition and len(definition) > len(slot["best_def"]):
+            slot["best_def"] = definition
             
-    # Select best definition (longest? most frequent?)
-    # For now: longest
-    
     final_terms = []
     for norm, data in consolidated.items():
-        best_def = max(data["definitions"], key=len) if data["definitions"] else ""
         best_eng = next(iter(data["term_english"])) if data["term_english"] else ""
         
         final_terms.append({
-            "hebrew": data["term_hebrew"],
+            "hebrew": norm,
             "english": best_eng,
-            "definition": best_def
+            "definition": data["best_def"]
         })
         
     final_terms.sort(key=lambda x: x["hebrew"])
     
     # Save YAML
-    with open(TERMINOLOGY_FILE, 'w', encoding='utf-8') as f:
-        yaml.dump(final_terms, f, allow_unicode=True)
+    TERMINOLOGY_FILE.write_bytes(yaml.dump(final_terms, Dumper=_Dumper, allow_unicode=True).encode('utf-8'))
     print(f"Wrote {len(final_terms)} terms to {TERMINOLOGY_FILE}")
     
     # Write Glossary
-    with open(GLOSSARY_FILE, 'w', encoding='utf-8') as f:
-        f.write("# מילון מושגים (Glossary)\n\n")
-        f.write("| מונח | אנגלית | הגדרה |\n")
-        f.write("|------|--------|-------|\n")
-        for t in final_terms:
-            eng = t["english"] if t["english"] else "-"
-            f.write(f"| **{t['hebrew']}** | {eng} | {t['definition']} |\n")
-            
+    rows = [f"| **{t['hebrew']}** | {t['english'] or '-'} | {t['definition']} |" for t in final_terms]
+    header = "# מילון מושגים (Glossary)\n\n| מונח | אנגלית | הגדרה |\n|------|--------|-------|\n"
+    GLOSSARY_FILE.write_bytes((header + "".join(row + "\n" for row in rows)).encode('utf-8'))
+
     print(f"Wrote glossary to {GLOSSARY_FILE}")
 
 if __name__ == "__main__":
@@ -1,12 +1,23 @@
-from playwright.sync_api import sync_playwright
 from src.config import config
-import time
+import aiofiles
+import asyncio
+import functools
+import html
+import httpx
 import os
 import re
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin
 
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Configure logger
 logger = logging.getLogger(__name__)
 if not logger.handlers:
@@ -16,27 +27,176 @@ if not logger.handlers:
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
+# Filesystem-unsafe characters and spaces map to "_"; runs of "_" then collapse
+_FN_TRANS = str.maketrans({c: '_' for c in '\\/*?:"<>| '})
+_RUN_US = re.compile(r'_+')
+
+# Transcript download links as they appear in raw (unrendered) unit HTML
+_TRANSCRIPT_HREF_RE = re.compile(r'href="([^"]*transcript[^"]*?\.txt)"')
+# Any .txt link, for scanning a single tab's (vertical's) HTML
+_TXT_HREF_RE = re.compile(r'href="([^"]+\.txt)"')
+_TAB_LINKS = ".sequence-navigation-tabs a.btn-link"
+
+@functools.lru_cache(maxsize=2048)
+def _sanitize_filename_cached(filename):
+    """Module-level, memoized body of Downloader.sanitize_filename."""
+    return _RUN_US.sub('_', filename.translate(_FN_TRANS)).strip('_')
+
+# edX course keys and the endpoints that take them
+_COURSE_KEY_RE = re.compile(r'course-v1:[^/?#]+')
+_OUTLINE_API = "https://app.campus.gov.il/api/course_home/outline"
+_LEARNING_COURSE_URL = "https://app.campus.gov.il/learning/course"
+
+# Course outline as [{title, units: [{index, title, url}]}]; a.href is already absolute
+_HIERARCHY_JS = """() => Array.from(document.querySelectorAll('.pgn_collapsible')).map(m => ({
+    title: m.querySelector('.collapsible-trigger span')?.innerText.trim() ?? null,
+    units: Array.from(m.querySelectorAll("a[href*='type@sequential']")).map((a, j) => ({
+        index: j + 1,
+        title: a.innerText.trim(),
+        url: a.href
+    }))
+}))"""
+
+# Chromium switches that skip work the crawler never needs (images, sync, extensions, ...)
+_LAUNCH_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=TranslateUI,InterestFeedContentSuggestions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+]
+
+# Subresources the crawler never reads; scripts and documents stay allowed so iframes initialize
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar", "facebook.net")
+
+def _is_blocked(request):
+    return request.resource_type in _BLOCKED_RESOURCE_TYPES or any(h in request.url for h in _BLOCKED_HOSTS)
+
+def _route_non_essential(route):
+    """Route handler that aborts non-essential requests (sync API)."""
+    if _is_blocked(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+async def _route_non_essential_async(route):
+    """Route handler that aborts non-essential requests (async API)."""
+    if _is_blocked(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def _existing_names(path):
+    """Names already present in a directory, from a single scandir (empty if missing)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+# Transcript candidates in one frame, in a single round-trip: a.btn links whose label
+# reads like "Download Text (.txt)" or whose href is a .txt file, then <button>s with
+# such a label (by index among the frame's buttons, so Python can click them)
+_TRANSCRIPT_CANDIDATES_JS = """() => {
+    const isTranscript = t => (t.includes('Download') || t.includes('הורד'))
+        && (t.includes('(.txt)') || t.includes('Text') || t.includes('טקסט'));
+    const out = [];
+    document.querySelectorAll('a.btn').forEach(a => {
+        const text = a.innerText || '';
+        const href = a.getAttribute('href') || '';
+        if (isTranscript(text) || href.includes('.txt')) out.push({tag: 'A', text, href});
+    });
+    document.querySelectorAll('button').forEach((b, index) => {
+        const text = b.innerText || '';
+        if (isTranscript(text)) out.push({tag: 'BUTTON', text, index});
+    });
+    return out;
+}"""
+
+def _link_in_html(page_html, base_url, pattern=_TRANSCRIPT_HREF_RE):
+    """Absolute URL of pattern's first href in page_html (relative to base_url), or None."""
+    match = pattern.search(page_html) if page_html else None
+    return urljoin(base_url, html.unescape(match.group(1))) if match else None
+
+class BrowserPool:
+    """Keeps warm browsers so Downloaders only pay for a new context, not a launch."""
+
+    def __init__(self, size=3, headless=True):
+        from playwright.sync_api import sync_playwright
+
+        self._pw = sync_playwright().start()
+        self._browsers = [self._pw.chromium.launch(headless=headless, args=_LAUNCH_ARGS) for _ in range(size)]
+        self._q = queue.Queue()
+        for browser in self._browsers:
+            self._q.put(browser)
+
+    def acquire(self):
+        """Take a browser out of the pool, blocking until one is free."""
+        return self._q.get()
+
+    def release(self, browser):
+        """Hand a browser back to the pool."""
+        self._q.put(browser)
+
+    def close(self):
+        """Close every browser and stop playwright."""
+        for browser in self._browsers:
+            browser.close()
+        self._pw.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 class Downloader:
-    def __init__(self, username, password, headless=True):
+    def __init__(self, username, password, headless=True, pool=None):
         self.username = username
         self.password = password
         self.headless = headless
+        self.pool = pool
         self.browser = None
         self.context = None
         self.page = None
         self.playwright = None
+        self._http = None
         self.logger = logger
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
     def start(self):
-        """Initialize playwright and browser."""
-        self.logger.info("Initializing browser...")
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        """Initialize playwright and browser (or borrow a browser from the pool)."""
+        if self.pool:
+            self.browser = self.pool.acquire()
+        else:
+            # Imported here so that importing this module stays cheap
+            from playwright.sync_api import sync_playwright
+
+            self.logger.info("Initializing browser...")
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=self.headless, args=_LAUNCH_ARGS)
         self.context = self.browser.new_context()
+        self.context.route("**/*", _route_non_essential)
         self.page = self.context.new_page()
 
     def stop(self):
-        """Close browser and stop playwright."""
+        """Close browser and stop playwright; pooled browsers only lose their context."""
+        if self._http:
+            self._http.close()
+            self._http = None
+        if self.pool:
+            if self.browser:
+                self.context.close()
+                self.pool.release(self.browser)
+                self.browser = self.context = self.page = None
+            return
         if self.browser:
             self.logger.info("Closing browser.")
             self.browser.close()
@@ -83,11 +243,7 @@ class Downloader:
 
     def sanitize_filename(self, filename):
         """Sanitize filename to be safe for the filesystem."""
-        forbidden_chars = r'[\\/*?:"<<>>|"]'
-        sanitized = re.sub(forbidden_chars, '_', filename)
-        sanitized = sanitized.replace(' ', '_')
-        sanitized = re.sub(r'_+', '_', sanitized)
-        return sanitized.strip('_')
+        return _sanitize_filename_cached(filename)
 
     def get_course_hierarchy(self):
         """
@@ -106,25 +262,29 @@ class Downloader:
             course_slug = course_url.rstrip('/').split('/')[-1]
             # Convert to learning URL format
             # This is a heuristic - may need adjustment based on actual URL pattern
-            learning_url = "https://app.campus.gov.il/learning/course/course-v1:TAU+ACD_RFP1_HowToBeatViruses_HE+2022_1/home"
-            self.logger.info(f"Navigating to course home: {learning_url}")
-            self.page.goto(learning_url)
+            target_url = "https://app.campus.gov.il/learning/course/course-v1:TAU+ACD_RFP1_HowToBeatViruses_HE+2022_1/home"
         else:
-            self.logger.info(f"Navigating to course: {course_url}")
-            self.page.goto(course_url)
+            target_url = course_url
         
-        self.page.wait_for_load_state("networkidle")
+        # The outline API returns the whole structure as JSON, with no rendering
+        key_match = _COURSE_KEY_RE.search(target_url)
+        if key_match:
+            hierarchy = self._outline_hierarchy(key_match.group(0))
+            if hierarchy:
+                self.logger.info(f"Extracted hierarchy from outline API: {len(hierarchy)} modules, {sum(len(m['units']) for m in hierarchy)} total units")
+                return hierarchy
         
-        # Wait for course content to load
+        self.logger.info(f"Navigating to course: {target_url}")
+        self.page.goto(target_url)
+        
+        # Wait for the course outline itself rather than for the network to go
+        # idle (analytics beacons on edX pages can keep it busy for a long time)
         try:
-            self.page.wait_for_selector(".pgn_collapsible", timeout=10000)
+            self.page.wait_for_selector(".pgn_collapsible .collapsible-trigger", timeout=15000)
             self.logger.info("Course content loaded")
         except Exception as e:
             self.logger.warning(f"Timeout waiting for course content: {e}")
         
-        # Additional wait for JavaScript
-        time.sleep(2)
-        
         # Click "Expand all" button to reveal all course content
         try:
             # Updated selector based on actual DOM structure
@@ -132,86 +292,131 @@ class Downloader:
             if expand_button:
                 self.logger.info("Expanding all course sections...")
                 expand_button.click()
-                time.sleep(3)  # Increased wait for expansion
+                try:
+                    # Expansion is done once unit links are in the DOM
+                    self.page.wait_for_function(
+                        "document.querySelectorAll('a[href*=\"type@sequential\"]').length > 0",
+                        timeout=10000,
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Timeout waiting for sections to expand: {e}")
             else:
                 self.logger.warning("Could not find expand all button")
         except Exception as e:
             self.logger.warning(f"Could not find/click expand button: {e}")
         
-        hierarchy = []
-        
-        # Find all modules (sections)
-        # Based on DOM investigation: each module is a .pgn_collapsible element
-        module_elements = self.page.query_selector_all(".pgn_collapsible")
+        # Walk modules and units in the browser and return them in one round-trip
+        # (each .pgn_collapsible is a module; its sequential links are the units)
+        modules = self.page.evaluate(_HIERARCHY_JS)
         
-        self.logger.info(f"Found {len(module_elements)} modules")
+        self.logger.info(f"Found {len(modules)} modules")
         
-        for module_idx, module_elem in enumerate(module_elements, start=1):
-            # Extract module title from .collapsible-trigger span
-            title_elem = module_elem.query_selector(".collapsible-trigger span")
-            if not title_elem:
+        hierarchy = []
+        for module_idx, module in enumerate(modules, start=1):
+            if not module["title"]:
                 self.logger.warning(f"Could not find title for module {module_idx}")
                 continue
             
-            module_title = title_elem.inner_text().strip()
-            self.logger.info(f"Processing module {module_idx}: {module_title}")
-            
-            module = {
-                "index": module_idx,
-                "title": module_title,
-                "units": []
-            }
-            
-            # Find all units (sequentials) within this module
-            unit_links = module_elem.query_selector_all("a[href*='type@sequential']")
+            self.logger.info(f"Processing module {module_idx}: {module['title']}")
+            for unit in module["units"]:
+                self.logger.info(f"  Found unit {unit['index']}: {unit['title']}")
             
-            for unit_idx, unit_link in enumerate(unit_links, start=1):
-                unit_title = unit_link.inner_text().strip()
-                unit_url = unit_link.get_attribute("href")
-                
-                # Make URL absolute if it's relative
-                if unit_url and not unit_url.startswith('http'):
-                    unit_url = f"https://app.campus.gov.il{unit_url}"
-                
-                unit = {
-                    "index": unit_idx,
-                    "title": unit_title,
-                    "url": unit_url
-                }
-                
-                module["units"].append(unit)
-                self.logger.info(f"  Found unit {unit_idx}: {unit_title}")
-            
-            hierarchy.append(module)
+            hierarchy.append({"index": module_idx, "title": module["title"], "units": module["units"]})
         
         self.logger.info(f"Extracted hierarchy: {len(hierarchy)} modules, {sum(len(m['units']) for m in hierarchy)} total units")
         return hierarchy
 
+    def _module_path(self, module, output_dir):
+        """Folder for a module, computed once and cached on the module as 'path'."""
+        if 'path' not in module:
+            module_name = f"{module['index']:02d}_{self.sanitize_filename(module['title'])}"
+            module['path'] = os.path.join(output_dir, module_name)
+        return module['path']
+
+    def _outline_hierarchy(self, course_key):
+        """Build the hierarchy from edX's course outline API; None if it is unavailable."""
+        try:
+            response = self.page.request.get(f"{_OUTLINE_API}/{course_key}")
+            if response.status != 200:
+                return None
+            blocks = response.json()["course_blocks"]["blocks"]
+            course = next(b for b in blocks.values() if b["type"] == "course")
+        except Exception as e:
+            self.logger.warning(f"Course outline API unavailable, falling back to the page: {e}")
+            return None
+        
+        # course -> chapters (modules) -> sequentials (units)
+        hierarchy = []
+        for module_idx, chapter_id in enumerate(course.get("children", []), start=1):
+            chapter = blocks[chapter_id]
+            sequential_ids = [b for b in chapter.get("children", []) if blocks.get(b, {}).get("type") == "sequential"]
+            hierarchy.append({
+                "index": module_idx,
+                "title": chapter["display_name"].strip(),
+                "units": [
+                    {
+                        "index": unit_idx,
+                        "title": blocks[block_id]["display_name"].strip(),
+                        "url": f"{_LEARNING_COURSE_URL}/{course_key}/{block_id}"
+                    }
+                    for unit_idx, block_id in enumerate(sequential_ids, start=1)
+                ]
+            })
+        return hierarchy
+
     def create_directories(self, hierarchy, output_dir):
-        """Create the directory structure based on the hierarchy."""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        """Create the directory structure based on the hierarchy.
+
+        Module paths and unit filenames are stored on the hierarchy ('path',
+        'filename') so later passes reuse them instead of recomputing.
+        """
+        os.makedirs(output_dir, exist_ok=True)
             
         for module in hierarchy:
-            module_name = f"{module['index']:02d}_{self.sanitize_filename(module['title'])}"
-            module_path = os.path.join(output_dir, module_name)
-            if not os.path.exists(module_path):
-                os.makedirs(module_path)
-            module['path'] = module_path
+            module_path = self._module_path(module, output_dir)
+            os.makedirs(module_path, exist_ok=True)
             
             for unit in module['units']:
-                unit_name = f"{unit['index']:02d}_{self.sanitize_filename(unit['title'])}"
-                unit['filename'] = unit_name + ".txt"
+                if 'filename' not in unit:
+                    unit['filename'] = f"{unit['index']:02d}_{self.sanitize_filename(unit['title'])}.txt"
+
+    def _candidate_actions(self, candidates, frame_url):
+        """Turn one frame's _TRANSCRIPT_CANDIDATES_JS result into actions, in order.
+
+        Yields ('url', absolute href) for a link, after which callers stop,
+        and ('button', index) for a button to click and capture the download.
+        """
+        for candidate in candidates:
+            text = candidate["text"]
+            # 1. Standard links (<a>): fetch the href
+            if candidate["tag"] == "A":
+                href = candidate["href"]
+                self.logger.info(f"Found transcript link: {text} -> {href}")
+                if href and not href.startswith(('http:', 'https:')):
+                    href = urljoin(frame_url, href)
+                yield ('url', href)
+                return
+            # 2. Buttons (<button>): click and capture the download
+            self.logger.info(f"Found transcript button: {text}")
+            yield ('button', candidate["index"])
 
     def download_transcript(self, unit_url):
         """Download transcript from a unit page (handling iframes and tabs)."""
         if not self.page:
             self.start()
             
+        # Cheap path first: look for the link in the raw HTML, no rendering
+        transcript_url = self._fetch_transcript_url(unit_url)
+        if transcript_url:
+            self.logger.info(f"Found transcript link in page source: {transcript_url}")
+            content = self._download_file_from_url(transcript_url)
+            if content:
+                return content
+
         self.logger.info(f"Visiting unit: {unit_url}")
-        self.page.goto(unit_url)
         try:
-            self.page.wait_for_load_state("domcontentloaded", timeout=30000)
+            # Don't wait for every subresource ("load"); the xblock iframe is all we need
+            self.page.goto(unit_url, wait_until="domcontentloaded", timeout=15000)
         except Exception:
             self.logger.warning("Timeout waiting for page load, proceeding anyway...")
         
@@ -219,55 +424,31 @@ class Downloader:
         def find_download_in_frames():
             for frame in self.page.frames:
                 try:
-                    # 1. Check for standard Links (<a>)
-                    links = frame.query_selector_all("a.btn")
-                    for link in links:
-                        try:
-                            text = link.inner_text()
-                            href = link.get_attribute("href")
-                            is_download_text = ("Download" in text or "הורד" in text) and ("(.txt)" in text or "Text" in text or "טקסט" in text)
-                            is_txt_href = href and (".txt" in href)
-                            
-                            if is_download_text or is_txt_href:
-                                self.logger.info(f"Found transcript link: {text} -> {href}")
-                                if href and not href.startswith(('http:', 'https:')):
-                                    href = urljoin(frame.url, href)
-                                return ('url', href)
-                        except Exception:
-                            continue
-
-                    # 2. Check for Buttons (<button>)
-                    buttons = frame.query_selector_all("button")
-                    for btn in buttons:
-                        try:
-                            text = btn.inner_text()
-                            # Check for "Download" and "Text"/.txt
-                            if ("Download" in text or "הורד" in text) and ("(.txt)" in text or "Text" in text or "טקסט" in text):
-                                self.logger.info(f"Found transcript button: {text}")
-                                # Click and capture download
-                                with self.page.expect_download(timeout=10000) as download_info:
-                                    btn.click()
-                                download = download_info.value
-                                path = download.path()
-                                
-                                # Read content
-                                with open(path, 'r', encoding='utf-8') as f:
-                                    content = f.read()
-                                
-                                # Clean up temporary file if possible? Playwright manages it.
-                                return ('content', content)
-                        except Exception:
-                            # self.logger.warning(f"Button check failed: {e}")
-                            continue
-
+                    candidates = frame.evaluate(_TRANSCRIPT_CANDIDATES_JS)
                 except Exception:
                     continue
+                for kind, value in self._candidate_actions(candidates, frame.url):
+                    if kind == 'url':
+                        return ('url', value)
+                    try:
+                        with self.page.expect_download(timeout=10000) as download_info:
+                            frame.locator("button").nth(value).click()
+                        download = download_info.value
+                        path = download.path()
+                        
+                        # Read content
+                        with open(path, 'r', encoding='utf-8') as f:
+                            content = f.read()
+                        
+                        return ('content', content)
+                    except Exception:
+                        continue
             return None
 
         try:
             # Wait for content iframe to account for domcontentloaded being too early
             try:
-                self.page.wait_for_selector("iframe", state="attached", timeout=10000)
+                self.page.wait_for_selector("iframe[src*='xblock']", state="attached", timeout=8000)
             except:
                 pass
                 
@@ -282,9 +463,17 @@ class Downloader:
         except Exception as e:
             self.logger.warning(f"Error checking first tab: {e}")
 
-        # 2. Iterate through other tabs (verticals)
+        # 2. Scan each tab's (vertical's) HTML directly before clicking through them
+        transcript_url = self._scan_tab_sources()
+        if transcript_url:
+            self.logger.info(f"Found transcript link in tab source: {transcript_url}")
+            content = self._download_file_from_url(transcript_url)
+            if content:
+                return content
+
+        # 3. Iterate through other tabs (verticals)
         try:
-            tabs = self.page.query_selector_all(".sequence-navigation-tabs a.btn-link")
+            tabs = self.page.query_selector_all(_TAB_LINKS)
             if not tabs:
                 return None
             
@@ -295,9 +484,9 @@ class Downloader:
                 tab.click()
                 try:
                     self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+                    self.page.wait_for_selector("iframe", state="attached", timeout=3000)
                 except:
                     pass
-                time.sleep(1) 
                 
                 result = find_download_in_frames()
                 if result:
@@ -314,38 +503,192 @@ class Downloader:
         self.logger.warning("No transcript found in any tab.")
         return None
 
+    def _http_client(self, refresh=False):
+        """Plain HTTP client carrying the browser session's cookies (built lazily)."""
+        if self._http is None or refresh:
+            if self._http is not None:
+                self._http.close()
+            cookies = httpx.Cookies()
+            for c in self.context.cookies():
+                cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+            self._http = httpx.Client(http2=HTTP2_AVAILABLE, cookies=cookies, follow_redirects=True, timeout=10)
+        return self._http
+
+    def _http_get(self, url):
+        """GET a URL outside the browser; returns the body on 200, else None.
+
+        A 401 means the copied cookies went stale, so they are re-read from
+        the browser context once before giving up. Network errors and
+        timeouts are logged and also give None, so callers fall back to the
+        browser instead of aborting.
+        """
+        try:
+            response = self._http_client().get(url)
+            if response.status_code == 401:
+                response = self._http_client(refresh=True).get(url)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"HTTP request failed for {url}: {e}")
+            return None
+        return response.text if response.status_code == 200 else None
+
+    def _fetch_transcript_url(self, unit_url):
+        """Find a transcript link in the unit's raw HTML, fetched without the browser."""
+        if not self.context:
+            return None
+        try:
+            return _link_in_html(self._http_get(unit_url), unit_url)
+        except Exception as e:
+            self.logger.warning(f"Could not fetch unit HTML: {e}")
+            return None
+
+    def _scan_tab_sources(self):
+        """Find a .txt link in any tab's HTML, fetched over HTTP instead of clicking the tab."""
+        if not self.context:
+            return None
+        try:
+            tab_hrefs = self.page.eval_on_selector_all(_TAB_LINKS, "els => els.map(e => e.href)")
+            for href in tab_hrefs:
+                transcript_url = _link_in_html(self._http_get(href), href, _TXT_HREF_RE)
+                if transcript_url:
+                    return transcript_url
+        except Exception as e:
+            self.logger.warning(f"Could not scan tab sources: {e}")
+        return None
+
     def _download_file_from_url(self, url):
-        """Download file content from URL using the browser's context."""
-        response = self.page.request.get(url)
-        if response.status == 200:
-            return response.text()
+        """Download file content from URL over the session's keep-alive HTTP client."""
+        return self._http_get(url)
+
+    async def download_transcript_async(self, page, unit_url):
+        """Async counterpart of download_transcript, driving the given page."""
+        async def get_text(url):
+            response = await page.request.get(url)
+            return await response.text() if response.status == 200 else None
+
+        try:
+            transcript_url = _link_in_html(await get_text(unit_url), unit_url)
+        except Exception:
+            transcript_url = None
+        if transcript_url:
+            self.logger.info(f"Found transcript link in page source: {transcript_url}")
+            content = await get_text(transcript_url)
+            if content:
+                return content
+
+        self.logger.info(f"Visiting unit: {unit_url}")
+        try:
+            # Don't wait for every subresource ("load"); the xblock iframe is all we need
+            await page.goto(unit_url, wait_until="domcontentloaded", timeout=15000)
+        except Exception:
+            self.logger.warning("Timeout waiting for page load, proceeding anyway...")
+
+        async def find_download_in_frames():
+            for frame in page.frames:
+                try:
+                    candidates = await frame.evaluate(_TRANSCRIPT_CANDIDATES_JS)
+                except Exception:
+                    continue
+                for kind, value in self._candidate_actions(candidates, frame.url):
+                    if kind == 'url':
+                        return ('url', value)
+                    try:
+                        async with page.expect_download(timeout=10000) as download_info:
+                            await frame.locator("button").nth(value).click()
+                        download = await download_info.value
+                        path = await download.path()
+                        with open(path, 'r', encoding='utf-8') as f:
+                            return ('content', f.read())
+                    except Exception:
+                        continue
+            return None
+
+        async def resolve(result):
+            rtype, rvalue = result
+            return await get_text(rvalue) if rtype == 'url' else rvalue
+
+        try:
+            try:
+                await page.wait_for_selector("iframe[src*='xblock']", state="attached", timeout=8000)
+            except Exception:
+                pass
+            result = await find_download_in_frames()
+            if result:
+                self.logger.info(f"Found transcript in first tab ({result[0]}).")
+                return await resolve(result)
+        except Exception as e:
+            self.logger.warning(f"Error checking first tab: {e}")
+
+        try:
+            for href in await page.eval_on_selector_all(_TAB_LINKS, "els => els.map(e => e.href)"):
+                transcript_url = _link_in_html(await get_text(href), href, _TXT_HREF_RE)
+                if transcript_url:
+                    self.logger.info(f"Found transcript link in tab source: {transcript_url}")
+                    content = await get_text(transcript_url)
+                    if content:
+                        return content
+        except Exception as e:
+            self.logger.warning(f"Could not scan tab sources: {e}")
+
+        try:
+            tabs = await page.query_selector_all(_TAB_LINKS)
+            for i, tab in enumerate(tabs):
+                await tab.click()
+                try:
+                    await page.wait_for_load_state("domcontentloaded", timeout=5000)
+                    await page.wait_for_selector("iframe", state="attached", timeout=3000)
+                except Exception:
+                    pass
+
+                result = await find_download_in_frames()
+                if result:
+                    self.logger.info(f"Found transcript in tab {i+1} ({result[0]}).")
+                    return await resolve(result)
+        except Exception as e:
+            self.logger.warning(f"Error iterating tabs: {e}")
+
+        self.logger.warning("No transcript found in any tab.")
         return None
 
     def save_transcript(self, content, folder_path, filename):
         """Save transcript content to a file."""
-        if not os.path.exists(folder_path):
-            os.makedirs(folder_path)
+        os.makedirs(folder_path, exist_ok=True)
         file_path = os.path.join(folder_path, filename)
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
         return file_path
 
-    def bulk_download(self, hierarchy, output_dir):
-        """Iterate through hierarchy and download missing transcripts."""
+    async def save_transcript_async(self, content, folder_path, filename):
+        """Save transcript content without blocking the event loop on disk."""
+        os.makedirs(folder_path, exist_ok=True)
+        file_path = os.path.join(folder_path, filename)
+        async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
+            await f.write(content)
+        return file_path
+
+    def bulk_download(self, hierarchy, output_dir, concurrency=1):
+        """Iterate through hierarchy and download missing transcripts.
+
+        With concurrency > 1 the units are fetched in parallel pages via
+        bulk_download_async, reusing this session's login cookies. The sync
+        Playwright session keeps an event loop running on this thread, so the
+        async download runs its own loop in a worker thread.
+        """
+        if concurrency > 1:
+            storage_state = self.context.storage_state() if self.context else None
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, self.bulk_download_async(
+                    hierarchy, output_dir, max_concurrency=concurrency, storage_state=storage_state)).result()
+
         results = {"downloaded": [], "skipped": [], "failed": []}
         
         self.logger.info("Starting bulk download...")
         
         for module in hierarchy:
-            module_path = module.get('path')
-            if not module_path:
-                module_name = f"{module['index']:02d}_{self.sanitize_filename(module['title'])}"
-                module_path = os.path.join(output_dir, module_name)
+            module_path = self._module_path(module, output_dir)
+            present = _existing_names(module_path)
                 
             for unit in module['units']:
-                file_path = os.path.join(module_path, unit['filename'])
-                
-                if os.path.exists(file_path):
+                if unit['filename'] in present:
                     self.logger.info(f"Skipping (already exists): {unit['filename']}")
                     results["skipped"].append(unit)
                     continue
@@ -363,6 +706,66 @@ class Downloader:
         self.logger.info(f"Bulk download complete. Summary: {len(results['downloaded'])} downloaded, {len(results['skipped'])} skipped, {len(results['failed'])} failed.")
         return results
 
+    async def bulk_download_async(self, hierarchy, output_dir, max_concurrency=5, storage_state=None):
+        """Download missing transcripts concurrently against one shared browser.
+
+        Each in-flight unit gets its own BrowserContext (seeded with the login
+        storage_state), so units do not share cookies, caches or downloads.
+        """
+        results = {"downloaded": [], "skipped": [], "failed": []}
+
+        self.logger.info(f"Starting concurrent bulk download (max {max_concurrency} at a time)...")
+
+        pending = []
+        for module in hierarchy:
+            module_path = self._module_path(module, output_dir)
+            present = _existing_names(module_path)
+
+            for unit in module['units']:
+                if unit['filename'] in present:
+                    self.logger.info(f"Skipping (already exists): {unit['filename']}")
+                    results["skipped"].append(unit)
+                else:
+                    pending.append((module_path, unit))
+
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless, args=_LAUNCH_ARGS)
+            sem = asyncio.Semaphore(max_concurrency)
+
+            async def sem_download(module_path, unit):
+                async with sem:
+                    self.logger.info(f"Downloading: {unit['filename']}...")
+                    context = await browser.new_context(storage_state=storage_state)
+                    try:
+                        await context.route("**/*", _route_non_essential_async)
+                        page = await context.new_page()
+                        content = await self.download_transcript_async(page, unit['url'])
+                    finally:
+                        await context.close()
+                if content:
+                    await self.save_transcript_async(content, module_path, unit['filename'])
+                    self.logger.info(f"Successfully downloaded: {unit['title']}")
+                    return True
+                return False
+
+            tasks = [asyncio.create_task(sem_download(module_path, unit)) for module_path, unit in pending]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            await browser.close()
+
+        for (_, unit), outcome in zip(pending, outcomes):
+            if outcome is True:
+                results["downloaded"].append(unit)
+            else:
+                if isinstance(outcome, Exception):
+                    self.logger.error(f"Error downloading {unit['title']}: {outcome}")
+                self.logger.error(f"Failed to download: {unit['title']}")
+                results["failed"].append(unit)
+
+        self.logger.info(f"Bulk download complete. Summary: {len(results['downloaded'])} downloaded, {len(results['skipped'])} skipped, {len(results['failed'])} failed.")
+        return results
+
     def generate_summary_report(self, results, output_dir):
         """Generate a summary.txt report file."""
         report_path = os.path.join(output_dir, "summary.txt")
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
+import asyncio
 import os
-import json
+import orjson
 import time
 from pathlib import Path
 from tqdm import tqdm
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 from typing import List, Optional
 from google import genai
 from google.genai import types
@@ -23,41 +25,51 @@ CHUNKS_FILE = Path("ops/artifacts/chunks.jsonl")
 CLAIMS_FILE = Path("ops/artifacts/claims.jsonl")
 ENTITIES_FILE = Path("ops/artifacts/entities.jsonl")
 LOG_FILE = Path("ops/logs/extraction.jsonl")
+IDS_FILE = Path("ops/logs/processed.ids")  # one successful chunk_id per line
+MAX_CONCURRENCY = 8
 
 # Schema Definitions
 class Claim(BaseModel):
     text: str = Field(..., description="The factual claim in Hebrew.")
     type: str = Field(..., enum=["definition", "mechanism", "comparison", "example", "fact"], description="Type of the claim.")
     confidence: str = Field(..., enum=["high", "low"], description="Confidence in the extraction.")
+    # Filled in after parsing; hidden from the schema sent to Gemini
+    evidence_chunk_id: SkipJsonSchema[Optional[str]] = None
 
 class Entity(BaseModel):
     term_hebrew: str = Field(..., description="Canonical Hebrew term.")
     term_english: Optional[str] = Field(None, description="English term if mentioned or implied.")
     definition: str = Field(..., description="Short definition based on the text.")
+    evidence_chunk_id: SkipJsonSchema[Optional[str]] = None
 
 class ChunkExtraction(BaseModel):
     claims: List[Claim]
     entities: List[Entity]
 
 def get_processed_chunk_ids():
-    """Load IDs of chunks already processed."""
+    """Load IDs of chunks already processed.
+
+    Reads the plain-text IDS_FILE sidecar when it is at least as new as the
+    log; otherwise rebuilds it from the JSONL log.
+    """
+    if IDS_FILE.exists() and (not LOG_FILE.exists() or IDS_FILE.stat().st_mtime >= LOG_FILE.stat().st_mtime):
+        return set(IDS_FILE.read_text(encoding='utf-8').splitlines())
+    
     ids = set()
     if LOG_FILE.exists():
         with open(LOG_FILE, 'r', encoding='utf-8') as f:
             for line in f:
                 try:
-                    data = json.loads(line)
+                    data = orjson.loads(line)
                     if data.get("status") == "success":
                         ids.add(data.get("chunk_id"))
                 except:
                     pass
+        IDS_FILE.write_text("".join(f"{chunk_id}\n" for chunk_id in ids), encoding='utf-8')
     return ids
 
-def process_chunk(client, chunk, model="gemini-2.0-flash"):
-    """Call Gemini to extract info from a chunk."""
-    text = chunk["text"]
-    
-    prompt = f"""
+def build_prompt(text):
+    return f"""
     You are an expert virology research assistant. Analyze the following Hebrew transcript text.
     Extract:
     1. Atomic factual claims (definitions, mechanisms, comparisons, facts).
@@ -67,16 +79,20 @@ def process_chunk(client, chunk, model="gemini-2.0-flash"):
     Transcript Text:
     {text}
     """
-    
+
+GENERATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=ChunkExtraction,
+    temperature=0.0
+)
+
+async def process_chunk_async(client, chunk, model="gemini-2.0-flash"):
+    """Call Gemini (through the client's aio surface) to extract info from a chunk."""
     try:
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=ChunkExtraction,
-                temperature=0.0
-            )
+            contents=build_prompt(chunk["text"]),
+            config=GENERATION_CONFIG
         )
         
         return response.parsed
@@ -85,90 +101,121 @@ def process_chunk(client, chunk, model="gemini-2.0-flash"):
         print(f"Error processing chunk {chunk['chunk_id']}: {e}")
         raise
 
-def main():
-    if not CHUNKS_FILE.exists():
-        print(f"Chunks file not found: {CHUNKS_FILE}")
-        return
-
-    # Initialize client
-    client = genai.Client(api_key=API_KEY)
+async def extract_with_retries(client, chunk, retries=3):
+    """Extract one chunk with backoff; returns (chunk, result, duration)."""
+    chunk_id = chunk["chunk_id"]
+    wait = 2
+    result = None
     
-    # Load chunks
-    chunks = []
-    with open(CHUNKS_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            chunks.append(json.loads(line))
-            
-    processed_ids = get_processed_chunk_ids()
-    to_process = [c for c in chunks if c["chunk_id"] not in processed_ids]
-    
-    print(f"Total chunks: {len(chunks)}. Processed: {len(processed_ids)}. To process: {len(to_process)}")
+    start_time = time.time()
     
-    # Ensure dirs
-    CLAIMS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    for attempt in range(retries):
+        try:
+            result = await process_chunk_async(client, chunk)
+            break
+        except Exception as e:
+            # simplistic backoff
+            if "429" in str(e) or "ResourceExhausted" in str(e):
+                print(f"Rate limit hit. Waiting {wait}s...")
+                await asyncio.sleep(wait)
+                wait *= 2
+            else:
+                print(f"Retry {attempt+1}/{retries} for {chunk_id}: {e}")
+                await asyncio.sleep(1)
     
+    return chunk, result, time.time() - start_time
+
+def iter_chunks(processed_ids):
+    """Yield the chunks not processed yet, reading the chunks file one line at a time."""
+    with open(CHUNKS_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            chunk = orjson.loads(line)
+            if chunk["chunk_id"] not in processed_ids:
+                yield chunk
+
+async def extract_all(client, chunks):
+    """Extract chunks with at most MAX_CONCURRENCY in flight, writing each result as it completes.
+
+    Chunks are pulled from the iterable only when a slot frees up, so only
+    the in-flight chunks are held in memory.
+    """
     with open(CLAIMS_FILE, 'a', encoding='utf-8') as claims_f, \
          open(ENTITIES_FILE, 'a', encoding='utf-8') as entities_f, \
-         open(LOG_FILE, 'a', encoding='utf-8') as log_f:
+         open(LOG_FILE, 'a', encoding='utf-8') as log_f, \
+         open(IDS_FILE, 'a', encoding='utf-8') as ids_f:
          
-        for chunk in tqdm(to_process, desc="Extracting"):
+        def write_result(chunk, result, duration):
             chunk_id = chunk["chunk_id"]
             
-            retries = 3
-            wait = 2
-            result = None
-            
-            start_time = time.time()
-            
-            for attempt in range(retries):
-                try:
-                    result = process_chunk(client, chunk)
-                    break
-                except Exception as e:
-                    # simplistic backoff
-                    if "429" in str(e) or "ResourceExhausted" in str(e):
-                        print(f"Rate limit hit. Waiting {wait}s...")
-                        time.sleep(wait)
-                        wait *= 2
-                    else:
-                        print(f"Retry {attempt+1}/{retries} for {chunk_id}: {e}")
-                        time.sleep(1)
-            
-            duration = time.time() - start_time
-            
             if result:
+                # Records are compact JSON lines (model_dump_json/orjson put no space
+                # after ',' or ':'), unlike the old json.dumps output; readers parse them
                 # Save claims
                 for claim in result.claims:
-                    record = claim.model_dump()
-                    record["evidence_chunk_id"] = chunk_id
-                    claims_f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    claim.evidence_chunk_id = chunk_id
+                    claims_f.write(claim.model_dump_json() + "\n")
                     
                 # Save entities
                 for entity in result.entities:
-                    record = entity.model_dump()
-                    record["evidence_chunk_id"] = chunk_id
-                    entities_f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    entity.evidence_chunk_id = chunk_id
+                    entities_f.write(entity.model_dump_json() + "\n")
                 
                 # Log success
-                log_f.write(json.dumps({
+                log_f.write(orjson.dumps({
                     "chunk_id": chunk_id,
                     "status": "success",
                     "duration": duration,
                     "claims_count": len(result.claims),
                     "entities_count": len(result.entities)
-                }) + "\n")
+                }).decode() + "\n")
+                ids_f.write(chunk_id + "\n")
                 claims_f.flush()
                 entities_f.flush()
                 log_f.flush()
+                ids_f.flush()
                 
             else:
                 # Log failure
-                log_f.write(json.dumps({
+                log_f.write(orjson.dumps({
                     "chunk_id": chunk_id,
                     "status": "failed",
                     "duration": duration
-                }) + "\n")
+                }).decode() + "\n")
+        
+        progress = tqdm(desc="Extracting")
+        in_flight = set()
+        
+        async def drain(return_when):
+            nonlocal in_flight
+            done, in_flight = await asyncio.wait(in_flight, return_when=return_when)
+            for task in done:
+                write_result(*task.result())
+            progress.update(len(done))
+        
+        for chunk in chunks:
+            if len(in_flight) >= MAX_CONCURRENCY:
+                await drain(asyncio.FIRST_COMPLETED)
+            in_flight.add(asyncio.create_task(extract_with_retries(client, chunk)))
+        if in_flight:
+            await drain(asyncio.ALL_COMPLETED)
+        progress.close()
+
+def main():
+    if not CHUNKS_FILE.exists():
+        print(f"Chunks file not found: {CHUNKS_FILE}")
+        return
+
+    # Initialize client
+    client = genai.Client(api_key=API_KEY)
+    
+    processed_ids = get_processed_chunk_ids()
+    print(f"Already processed: {len(processed_ids)}")
+    
+    # Ensure dirs
+    CLAIMS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    
+    asyncio.run(extract_all(client, iter_chunks(processed_ids)))
 
     print("Extraction complete.")
 
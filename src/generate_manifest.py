@@ -1,6 +1,17 @@
 import json
 from pathlib import Path
 
+CHAPTER_MAP = {
+    '03_שיעור_1': {'id': '01', 'title': 'Introduction & The Cell'},
+    '04_שיעור_2': {'id': '02', 'title': 'Macromolecules & DNA'},
+    '05_שיעור_3': {'id': '03', 'title': 'Viruses: Structure & Function'},
+    '06_שיעור_4': {'id': '04', 'title': 'Human Viral Diseases'},
+    '08_שיעור_5': {'id': '05', 'title': 'Innate Immunity'},
+    '09_שיעור_6': {'id': '06', 'title': 'Adaptive Immunity'},
+    '10_שיעור_7': {'id': '07', 'title': 'Vaccines'},
+    '11_שיעור_8': {'id': '08', 'title': 'Coronaviruses & COVID-19'}
+}
+
 def generate_book_manifest(scan_data):
     """
     Generates the book manifest structure from scan results.
@@ -22,25 +33,12 @@ def generate_book_manifest(scan_data):
     # Sort groups by name (assuming numbered folders like 03_..., 04_...)
     sorted_groups = sorted(grouped.keys())
     
-    chapter_map = {
-        '03_שיעור_1': {'id': '01', 'title': 'Introduction & The Cell'},
-        '04_שיעור_2': {'id': '02', 'title': 'Macromolecules & DNA'},
-        '05_שיעור_3': {'id': '03', 'title': 'Viruses: Structure & Function'},
-        '06_שיעור_4': {'id': '04', 'title': 'Human Viral Diseases'},
-        '08_שיעור_5': {'id': '05', 'title': 'Innate Immunity'},
-        '09_שיעור_6': {'id': '06', 'title': 'Adaptive Immunity'},
-        '10_שיעור_7': {'id': '07', 'title': 'Vaccines'},
-        '11_שיעור_8': {'id': '08', 'title': 'Coronaviruses & COVID-19'}
-    }
-    
     for group_name in sorted_groups:
-        # Check if it maps to a chapter
-        # Basic matching: check if group_name starts with known prefix or is in map
-        chap_info = None
-        for key in chapter_map:
-            if key in group_name:
-                chap_info = chapter_map[key]
-                break
+        # Directories are named '<NN>_שיעור_<n>_<title>', so the first three
+        # '_' fields are the map key; anything else falls back to a substring scan
+        chap_info = CHAPTER_MAP.get("_".join(group_name.split("_", 3)[:3]))
+        if chap_info is None:
+            chap_info = next((v for k, v in CHAPTER_MAP.items() if k in group_name), None)
         
         if chap_info:
             chapter = {
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
-import json
+import orjson
+import os
 import re
+import sys
+from multiprocessing import Pool
 from pathlib import Path
 from tqdm import tqdm
 
@@ -9,35 +12,44 @@ TRANSCRIPT_DIR = Path("/Users/arielindenbaum/Downloads/Viruses_Campus_IL_Full_Co
 OUTPUT_FILE = Path("ops/artifacts/chunks.jsonl")
 CHUNK_SIZE = 2000
 CHUNK_OVERLAP = 300
+WRITE_BUFFER_BYTES = 1 << 20  # gather ~1 MB of worker output per writev
+IOV_MAX = 1024  # buffers per writev call (POSIX minimum on Linux and macOS)
+
+_WS_RE = re.compile(r'\s+')
+# The same whitespace set as _WS_RE (str.isspace), matched on raw UTF-8 bytes:
+# ASCII whitespace and \x1c-\x1f, plus the encodings of U+0085, U+00A0, U+1680,
+# U+2000-U+200A, U+2028, U+2029, U+202F, U+205F and U+3000
+_WS_RE_B = re.compile(rb'(?:[\t-\r\x1c- ]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)+')
+# UTF-8 continuation bytes; deleting them leaves one byte per character
+_UTF8_CONTINUATION = bytes(range(0x80, 0xc0))
 
 def normalize_text(text):
     """Normalize whitespace and remove non-printable characters."""
     # Replace multiple whitespaces/newlines with single space
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return _WS_RE.sub(' ', text).strip()
 
 def chunk_text(text, size, overlap):
     """Yield chunks of text with overlap."""
-    if len(text) <= size:
-        yield text, 0, len(text)
+    n = len(text)
+    if n <= size:
+        yield text, 0, n
         return
     
+    # Look for a space to cut nicely in the last 10% of the chunk
+    lookback = int(size * 0.1)
     start = 0
-    while start < len(text):
-        end = min(start + size, len(text))
+    while start < n:
+        end = min(start + size, n)
         
-        # If we are not at the end, try to find a sentence break or space to cut nicely
-        if end < len(text):
-            # Look for a period or space in the last 10% of the chunk
-            lookback = int(size * 0.1)
-            # Find last space
+        # If we are not at the end, try to find a space to cut nicely
+        if end < n:
             last_space = text.rfind(' ', end - lookback, end)
             if last_space != -1:
                 end = last_space + 1 # Include the space
         
         yield text[start:end], start, end
         
-        if end == len(text):
+        if end == n:
             break
             
         start = end - overlap
@@ -45,7 +57,85 @@ def chunk_text(text, size, overlap):
         if start >= end:
             start = end
 
+def process_file(file_path):
+    """Read, normalize and chunk one transcript (runs in a worker process).
+
+    Returns (chunk count, the file's records serialized as JSONL bytes), with
+    None in place of the bytes if the file could not be read.
+    """
+    basename = file_path.stem
+    
+    try:
+        raw = file_path.read_bytes()
+        # Collapse whitespace on the bytes (same result as normalize_text),
+        # so only the shorter, collapsed buffer gets decoded
+        normalized = _WS_RE_B.sub(b' ', raw).strip().decode('utf-8')
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return 0, None
+
+    if not normalized:
+        return 0, b""
+
+    # One record dict per file; orjson serializes it immediately, so the
+    # per-chunk fields can be overwritten in place
+    record = {
+        "chunk_id": None,
+        "source_file": file_path.name,
+        "text": None,
+        "offset_start": 0,
+        "offset_end": 0,
+        # Characters as a text-mode read sees them: \r\n reads as one newline
+        "original_length": len(raw.translate(None, _UTF8_CONTINUATION)) - raw.count(b"\r\n")
+    }
+    buf = bytearray()
+    chunk_idx = 1
+    for chunk_content, start, end in chunk_text(normalized, CHUNK_SIZE, CHUNK_OVERLAP):
+        record["chunk_id"] = f"{basename}_{chunk_idx:04d}"
+        record["text"] = chunk_content
+        record["offset_start"] = start
+        record["offset_end"] = end
+        
+        buf += orjson.dumps(record)
+        buf += b"\n"
+        chunk_idx += 1
+    
+    return chunk_idx - 1, buf
+
+def writev_all(fd, bufs):
+    """Write every buffer with as few os.writev calls as possible, handling short writes."""
+    for i in range(0, len(bufs), IOV_MAX):
+        batch = bufs[i:i + IOV_MAX]
+        while batch:
+            written = os.writev(fd, batch)
+            # Drop buffers written in full; trim the one cut short, if any
+            done = 0
+            while done < len(batch) and written >= len(batch[done]):
+                written -= len(batch[done])
+                done += 1
+            batch = batch[done:]
+            if batch and written:
+                batch[0] = batch[0][written:]
+
+def _file_key(file_path):
+    """Checkpoint key for a transcript: its path, mtime and size."""
+    st = file_path.stat()
+    return f"{file_path}\t{st.st_mtime_ns}\t{st.st_size}"
+
+def load_checkpoint(done_file):
+    """Map each checkpointed transcript path to the key it was ingested under."""
+    if not done_file.exists():
+        return {}
+    return {key.rsplit('\t', 2)[0]: key for key in done_file.read_text(encoding='utf-8').splitlines() if key}
+
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Normalize and chunk course transcripts")
+    parser.add_argument("--progress", action="store_true", help="Show a tqdm progress bar")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and re-ingest every file")
+    args = parser.parse_args()
+    
     if not TRANSCRIPT_DIR.exists():
         print(f"Error: Transcript directory not found: {TRANSCRIPT_DIR}")
         return
@@ -54,42 +144,61 @@ def main():
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     files = sorted(list(TRANSCRIPT_DIR.rglob("*.txt")))
-    print(f"Found {len(files)} transcript files.")
+    
+    # Checkpoint: path/mtime/size keys of files whose chunks are already in
+    # OUTPUT_FILE. The run starts over, truncating both, when asked to, when
+    # the output is missing or empty, or when a checkpointed file has changed
+    # since (its old chunks cannot be taken back out of the output).
+    done_file = OUTPUT_FILE.with_suffix('.done')
+    keys = {f: _file_key(f) for f in files}
+    done = {} if args.restart else load_checkpoint(done_file)
+    if done and (not OUTPUT_FILE.exists() or OUTPUT_FILE.stat().st_size == 0
+                 or any(done.get(str(f), key) != key for f, key in keys.items())):
+        done = {}
+    todo = [f for f in files if str(f) not in done]
+    print(f"Found {len(files)} transcript files ({len(files) - len(todo)} already ingested).")
     
     total_chunks = 0
     
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as out_f:
-        for file_path in tqdm(files, desc="Ingesting"):
-            path = Path(file_path)
-            basename = path.stem
+    # Files are independent, so workers read and chunk them in parallel; this
+    # process is the single writer and keeps the output in sorted file order.
+    # Workers hand back pre-encoded bytes, which are gathered and written with
+    # one writev per ~1 MB instead of being copied into a write buffer.
+    fd = os.open(OUTPUT_FILE, os.O_WRONLY | os.O_CREAT | (os.O_APPEND if done else os.O_TRUNC), 0o644)
+    try:
+        with Pool(os.cpu_count()) as pool, open(done_file, 'a' if done else 'w', encoding='utf-8') as done_f:
+            pending = []
+            pending_names = []
+            pending_bytes = 0
+            
+            def flush():
+                # Chunks reach disk before their files are marked done
+                writev_all(fd, pending)
+                os.fsync(fd)
+                done_f.write("".join(f"{name}\n" for name in pending_names))
+                done_f.flush()
+                pending.clear()
+                pending_names.clear()
             
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    raw_text = f.read()
-            except Exception as e:
-                print(f"Error reading {path}: {e}")
-                continue
-
-            normalized = normalize_text(raw_text)
-            if not normalized:
-                continue
-
-            chunk_idx = 1
-            for chunk_content, start, end in chunk_text(normalized, CHUNK_SIZE, CHUNK_OVERLAP):
-                chunk_id = f"{basename}_{chunk_idx:04d}"
-                
-                record = {
-                    "chunk_id": chunk_id,
-                    "source_file": path.name,
-                    "text": chunk_content,
-                    "offset_start": start,
-                    "offset_end": end,
-                    "original_length": len(raw_text)
-                }
-                
-                out_f.write(json.dumps(record, ensure_ascii=False) + "\n")
-                chunk_idx += 1
-                total_chunks += 1
+            results = pool.imap(process_file, todo, chunksize=8)
+            if args.progress:
+                results = tqdm(results, total=len(todo), desc="Ingesting")
+            for i, (file_path, (count, blob)) in enumerate(zip(todo, results), start=1):
+                total_chunks += count
+                if not args.progress and i % 100 == 0:
+                    print(f"[{i}/{len(todo)}]", file=sys.stderr)
+                if blob is None:
+                    continue  # unreadable; retried on the next run
+                pending_names.append(keys[file_path])
+                if blob:
+                    pending.append(blob)
+                    pending_bytes += len(blob)
+                if pending_bytes >= WRITE_BUFFER_BYTES:
+                    flush()
+                    pending_bytes = 0
+            flush()
+    finally:
+        os.close(fd)
 
     print(f"Ingestion complete. Written {total_chunks} chunks to {OUTPUT_FILE}")
 
@@ -39,11 +39,25 @@ Workflow:
 
 import os
 import json
+import argparse
+import asyncio
+import hashlib
+import mmap
+import sqlite3
 import time
+import traceback
 from pathlib import Path
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from typing import List, Dict, Literal, Optional, Tuple
+from dataclasses import asdict, dataclass
+
+import httpx
+import orjson
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 try:
     from google import genai
@@ -62,22 +76,35 @@ except ImportError:
 API_KEY = os.environ.get("GEMINI_API_KEY")
 MODEL_NAME = "gemini-3-pro-preview"  # Gemini Pro 3 - highest quality
 MAX_REVISION_ROUNDS = 2
+AUTO_APPROVE_SCORE = 0.9  # first-round score that is accepted whatever the decision
+CONVERGENCE_DELTA = 0.02  # smaller gains between rounds end the revision loop
+QUESTIONS_HEADER = "## שאלות לתרגול"
+ANSWER_MARKER = "**תשובה:**"
+MIN_QUESTIONS = 4  # answered questions that make a usable practice section
+AVG_WORD_CHARS = 6  # Hebrew word plus separator, for length-based word estimates
+MAX_CONCURRENT_CHAPTERS = 3  # chapters in flight against the Gemini rate limit
+MIN_REQUEST_INTERVAL = 1.0  # seconds between Gemini requests, shared by all agents
+LLM_TIMEOUT_MS = 120_000
+MAX_CONNECTIONS = 32
 
 # Paths
 CLAIMS_FILE = Path("ops/artifacts/claims.jsonl")
 CHAPTER_PLAN_FILE = Path("ops/artifacts/chapter_plan.json")
 CHAPTERS_DIR = Path("book/chapters")
 LOGS_DIR = Path("ops/logs/publishing_pipeline")
+LLM_CACHE_FILE = Path("ops/cache/llm_responses.sqlite3")
+
+# Responses are only memoized for near-deterministic agents; set
+# LLM_CACHE_DISABLE=1 to always hit the API
+LLM_CACHE_MAX_TEMPERATURE = 0.3
+_llm_cache = None
 
 
-class ReviewDecision(Enum):
-    """Possible decisions from a reviewing agent."""
-    APPROVE = "approve"
-    REQUEST_REVISION = "request_revision"
-    REJECT = "reject"
+# Possible decisions from a reviewing agent
+ReviewDecision = Literal["approve", "request_revision", "reject"]
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentFeedback:
     """Feedback from one agent to another."""
     from_agent: str
@@ -88,7 +115,7 @@ class AgentFeedback:
     specific_fixes: List[Dict[str, str]]  # {"issue": ..., "suggestion": ...}
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPass:
     """Result from a single agent pass."""
     agent_name: str
@@ -101,7 +128,7 @@ class AgentPass:
     duration_seconds: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterHistory:
     """Complete history of a chapter through the pipeline."""
     chapter_id: str
@@ -113,6 +140,49 @@ class ChapterHistory:
     total_duration: float
 
 
+class RateLimiter:
+    """Spaces requests at least min_interval apart across concurrent callers."""
+    
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.next_slot = 0.0
+    
+    async def acquire(self):
+        """Reserve the next free slot and wait until it comes up."""
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def fit_evidence(lines: List[str], budget_tokens: int) -> str:
+    """Join whole evidence lines, in planner order, until the token budget is spent."""
+    kept = []
+    used = 0
+    for line in lines:
+        cost = len(line) // 4 + 1  # ~4 characters per token
+        if used + cost > budget_tokens:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+
+def get_llm_cache() -> Optional[sqlite3.Connection]:
+    """Open the shared on-disk response cache, or None if disabled."""
+    global _llm_cache
+    if os.environ.get("LLM_CACHE_DISABLE") == "1":
+        return None
+    if _llm_cache is None:
+        LLM_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _llm_cache = sqlite3.connect(LLM_CACHE_FILE)
+        _llm_cache.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+    return _llm_cache
+
+
 # =============================================================================
 # AGENT DEFINITIONS
 # =============================================================================
@@ -120,31 +190,72 @@ class ChapterHistory:
 class BaseAgent:
     """Base class for all publishing agents."""
     
-    def __init__(self, client, name: str, role: str, temperature: float = 0.3):
+    JSON_DECODER = json.JSONDecoder()
+    SYSTEM_PROMPT = ""
+    
+    def __init__(self, client, name: str, role: str, temperature: float = 0.3,
+                 limiter: Optional[RateLimiter] = None):
         self.client = client
+        self.limiter = limiter
         self.name = name
         self.role = role
         self.temperature = temperature
+        self.cache = get_llm_cache() if temperature <= LLM_CACHE_MAX_TEMPERATURE else None
+        # Built once: the system prompt travels as system_instruction, so every
+        # call from this agent shares the same prefix for provider-side caching
+        self.config = types.GenerateContentConfig(
+            temperature=temperature,
+            system_instruction=self.SYSTEM_PROMPT or None
+        )
     
-    def call_llm(self, prompt: str) -> str:
-        """Make LLM API call."""
-        response = self.client.models.generate_content(
+    async def call_llm(self, prompt: str) -> str:
+        """Make LLM API call on the async client, reusing cached responses."""
+        key = None
+        if self.cache is not None:
+            key = hashlib.sha256(
+                f"{MODEL_NAME}|{self.temperature}|{self.SYSTEM_PROMPT}|{prompt}".encode()
+            ).hexdigest()
+            row = self.cache.execute("SELECT text FROM responses WHERE key = ?", (key,)).fetchone()
+            if row:
+                return row[0]
+        
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        
+        # Stream the reply so chunks are collected as soon as they arrive
+        parts = []
+        async for chunk in await self.client.aio.models.generate_content_stream(
             model=MODEL_NAME,
             contents=prompt,
-            config=types.GenerateContentConfig(temperature=self.temperature)
-        )
-        return response.text
+            config=self.config
+        ):
+            if chunk.text:
+                parts.append(chunk.text)
+        text = "".join(parts)
+        
+        if key is not None and text:
+            with self.cache:
+                self.cache.execute(
+                    "INSERT OR REPLACE INTO responses (key, text) VALUES (?, ?)", (key, text)
+                )
+        return text
     
     def parse_json_response(self, response: str, default: Dict) -> Dict:
-        """Extract JSON from response."""
+        """Decode the JSON object that starts at the first '{', ignoring surrounding prose.
+
+        Returns default when that object does not decode (e.g. a trailing comma
+        or a truncated reply); nested objects further in are never used instead.
+        """
+        if not response:
+            return default
+        start = response.find('{')
+        if start < 0:
+            return default
         try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                return json.loads(response[json_start:json_end])
-        except:
-            pass
-        return default
+            data, _ = self.JSON_DECODER.raw_decode(response, start)
+        except json.JSONDecodeError:
+            return default
+        return data
 
 
 class SubjectMatterExpert(BaseAgent):
@@ -153,6 +264,8 @@ class SubjectMatterExpert(BaseAgent):
     Role: Write accurate, comprehensive content from source evidence
     """
     
+    EVIDENCE_TOKENS = 17_500  # whole claim lines, roughly the old 70k-char cap
+    
     SYSTEM_PROMPT = """אתה מומחה תוכן (Subject Matter Expert) בביולוגיה ווירולוגיה.
     
 תפקידך: לכתוב תוכן מדויק ומקיף מבוסס אך ורק על הראיות שסופקו.
@@ -166,29 +279,18 @@ class SubjectMatterExpert(BaseAgent):
 
 אם קיבלת משוב לתיקון, התייחס באופן ספציפי לכל נקודה."""
     
-    def write_draft(self, chapter_plan: Dict, evidence: str, 
+    async def write_draft(self, chapter_plan: Dict, evidence: List[str], 
                    feedback: List[AgentFeedback] = None) -> Tuple[str, float]:
         """Write or revise chapter draft."""
         
-        feedback_section = ""
-        if feedback:
-            feedback_section = "\n\n📝 משוב לתיקון:\n"
-            for fb in feedback:
-                feedback_section += f"מ-{fb.from_agent}:\n"
-                for comment in fb.comments:
-                    feedback_section += f"  • {comment}\n"
-                for fix in fb.specific_fixes:
-                    feedback_section += f"  → תקן: {fix['issue']} ← {fix['suggestion']}\n"
+        feedback_section = self.format_feedback(feedback)
         
         prompt = f"""
-{self.SYSTEM_PROMPT}
-
----
 פרק {chapter_plan['chapter_id']}: {chapter_plan['title']}
 {feedback_section}
 
 ראיות:
-{evidence[:70000]}
+{fit_evidence(evidence, self.EVIDENCE_TOKENS)}
 
 ---
 מבנה חובה:
@@ -205,17 +307,54 @@ class SubjectMatterExpert(BaseAgent):
 כתוב את הפרק (מינימום 1500 מילים):
 """
         
-        content = self.call_llm(prompt)
+        content = await self.call_llm(prompt)
+        content = content.replace("```markdown", "").replace("```", "").strip()
+        
+        return content, self.score_draft(content, revised=bool(feedback))
+    
+    async def write_revision(self, chapter_plan: Dict, previous_content: str,
+                             feedback: List[AgentFeedback]) -> Tuple[str, float]:
+        """Revise an existing draft from feedback alone, without resending evidence."""
+        
+        prompt = f"""
+פרק {chapter_plan['chapter_id']}: {chapter_plan['title']}
+{self.format_feedback(feedback)}
+
+טיוטה קודמת:
+{previous_content}
+
+---
+תקן את הטיוטה לפי המשוב בלבד. אל תוסיף עובדות שאינן בטיוטה או במשוב.
+שמור על המבנה והציטוטים הקיימים.
+
+החזר את הפרק המלא והמתוקן:
+"""
+        
+        content = await self.call_llm(prompt)
         content = content.replace("```markdown", "").replace("```", "").strip()
         
-        # Self-assess completeness
-        score = 0.75 if feedback else 0.7
+        return content, self.score_draft(content, revised=True)
+    
+    def format_feedback(self, feedback: List[AgentFeedback] = None) -> str:
+        """Render reviewer feedback as a prompt section."""
+        if not feedback:
+            return ""
+        parts = ["\n\n📝 משוב לתיקון:"]
+        for fb in feedback:
+            parts.append(f"מ-{fb.from_agent}:")
+            parts.extend(f"  • {comment}" for comment in fb.comments)
+            parts.extend(f"  → תקן: {fix['issue']} ← {fix['suggestion']}" for fix in fb.specific_fixes)
+        parts.append("")
+        return "\n".join(parts)
+    
+    def score_draft(self, content: str, revised: bool) -> float:
+        """Self-assess completeness."""
+        score = 0.75 if revised else 0.7
         if "## מטרות למידה" in content and "## סיכום מהיר" in content:
             score += 0.1
-        if len(content.split()) > 1500:
+        if len(content) // AVG_WORD_CHARS > 1500:
             score += 0.1
-            
-        return content, min(score, 1.0)
+        return min(score, 1.0)
 
 
 class DevelopmentalEditor(BaseAgent):
@@ -238,13 +377,10 @@ class DevelopmentalEditor(BaseAgent):
 אם נדרשים שינויים מבניים - בקש revision מה-SME.
 אם השינויים קוסמטיים - תקן בעצמך."""
     
-    def review(self, content: str, chapter_plan: Dict) -> Tuple[str, ReviewDecision, AgentFeedback, float]:
+    async def review(self, content: str, chapter_plan: Dict) -> Tuple[str, ReviewDecision, AgentFeedback, float]:
         """Review content for pedagogical quality."""
         
         prompt = f"""
-{self.SYSTEM_PROMPT}
-
----
 תוכן לבדיקה:
 {content}
 
@@ -261,7 +397,7 @@ class DevelopmentalEditor(BaseAgent):
 }}
 """
         
-        response = self.call_llm(prompt)
+        response = await self.call_llm(prompt)
         data = self.parse_json_response(response, {
             "decision": "approve",
             "pedagogical_score": 0.75,
@@ -270,7 +406,7 @@ class DevelopmentalEditor(BaseAgent):
             "improved_content": content
         })
         
-        decision = ReviewDecision.REQUEST_REVISION if data["decision"] == "request_revision" else ReviewDecision.APPROVE
+        decision = "request_revision" if data["decision"] == "request_revision" else "approve"
         
         # Build feedback for SME
         specific_fixes = [
@@ -300,6 +436,8 @@ class FactChecker(BaseAgent):
     Role: Verify all claims against source evidence
     """
     
+    EVIDENCE_TOKENS = 12_500  # whole claim lines, roughly the old 50k-char cap
+    
     SYSTEM_PROMPT = """אתה בודק עובדות (Fact Checker) קפדן.
 
 תפקידך: לוודא שכל טענה בטקסט נתמכת בראיות המקוריות.
@@ -314,19 +452,16 @@ class FactChecker(BaseAgent):
 תקן אי-דיוקים קטנים ישירות.
 בקש revision מה-SME לבעיות משמעותיות."""
     
-    def verify(self, content: str, evidence: str) -> Tuple[str, ReviewDecision, AgentFeedback, float]:
+    async def verify(self, content: str, evidence: List[str]) -> Tuple[str, ReviewDecision, AgentFeedback, float]:
         """Verify content accuracy against evidence."""
         
         prompt = f"""
-{self.SYSTEM_PROMPT}
-
----
 תוכן לאימות:
 {content}
 
 ---
 ראיות מקוריות:
-{evidence[:50000]}
+{fit_evidence(evidence, self.EVIDENCE_TOKENS)}
 
 ---
 החזר JSON:
@@ -342,7 +477,7 @@ class FactChecker(BaseAgent):
 }}
 """
         
-        response = self.call_llm(prompt)
+        response = await self.call_llm(prompt)
         data = self.parse_json_response(response, {
             "decision": "approve",
             "accuracy_score": 0.8,
@@ -351,7 +486,7 @@ class FactChecker(BaseAgent):
             "corrected_content": content
         })
         
-        decision = ReviewDecision.REQUEST_REVISION if data["decision"] == "request_revision" else ReviewDecision.APPROVE
+        decision = "request_revision" if data["decision"] == "request_revision" else "approve"
         
         # Build feedback
         major_issues = [c for c in data.get("unverified_claims", []) if c.get("severity") == "major"]
@@ -393,13 +528,10 @@ class CopyEditor(BaseAgent):
 - מונחים באנגלית: DNA, RNA, mRNA
 - הגדרות בפורמט: **מונח** (English)"""
     
-    def polish(self, content: str) -> Tuple[str, float]:
+    async def polish(self, content: str) -> Tuple[str, float]:
         """Polish content for language quality."""
         
         prompt = f"""
-{self.SYSTEM_PROMPT}
-
----
 תוכן לעריכה:
 {content}
 
@@ -412,7 +544,7 @@ class CopyEditor(BaseAgent):
 }}
 """
         
-        response = self.call_llm(prompt)
+        response = await self.call_llm(prompt)
         data = self.parse_json_response(response, {
             "polished_content": content,
             "edits_made": [],
@@ -454,13 +586,10 @@ class AssessmentDesigner(BaseAgent):
 - רמות קושי מגוונות
 - התמקדות בנקודות חובה למבחן"""
     
-    def create_assessment(self, content: str, chapter_title: str) -> Tuple[str, float]:
+    async def create_assessment(self, content: str, chapter_title: str) -> Tuple[str, float]:
         """Create assessment section."""
         
         prompt = f"""
-{self.SYSTEM_PROMPT}
-
----
 תוכן הפרק "{chapter_title}":
 {content}
 
@@ -468,21 +597,30 @@ class AssessmentDesigner(BaseAgent):
 צור את מקטע השאלות (## שאלות לתרגול):
 """
         
-        questions = self.call_llm(prompt)
+        questions = await self.call_llm(prompt)
         questions = questions.replace("```markdown", "").replace("```", "").strip()
         
         # Ensure proper header
         if not questions.startswith("## שאלות"):
             questions = "## שאלות לתרגול\n\n" + questions
         
-        # Score based on content
+        return questions, self.score_questions(questions)
+    
+    def score_questions(self, questions: str) -> float:
+        """Score a questions section based on its content."""
         score = 0.7
-        if questions.count("**תשובה:**") >= 4:
+        if questions.count(ANSWER_MARKER) >= MIN_QUESTIONS:
             score += 0.15
         if "שאלת חשיבה" in questions or "שאלות קצרות" in questions:
             score += 0.1
-            
-        return questions, min(score, 1.0)
+        return min(score, 1.0)
+
+
+async def timed(coro):
+    """Await a coroutine and return (result, elapsed seconds)."""
+    start = time.monotonic()
+    result = await coro
+    return result, time.monotonic() - start
 
 
 class SeniorEditor:
@@ -494,42 +632,58 @@ class SeniorEditor:
     def __init__(self, client):
         self.client = client
         self.claims_map = {}
+        self.claims_text_lines = {}  # claim_id -> formatted evidence line
+        
+        # One limiter paces every agent's requests, across all chapters
+        self.limiter = RateLimiter(MIN_REQUEST_INTERVAL)
         
         # Initialize all agents
-        self.sme = SubjectMatterExpert(client, "SME", "Subject Matter Expert", temperature=0.5)
-        self.dev_editor = DevelopmentalEditor(client, "DevEditor", "Developmental Editor", temperature=0.3)
-        self.fact_checker = FactChecker(client, "FactChecker", "Fact Checker", temperature=0.1)
-        self.copy_editor = CopyEditor(client, "CopyEditor", "Copy Editor", temperature=0.2)
-        self.assessment = AssessmentDesigner(client, "Assessment", "Assessment Designer", temperature=0.4)
+        self.sme = SubjectMatterExpert(client, "SME", "Subject Matter Expert", temperature=0.5, limiter=self.limiter)
+        self.dev_editor = DevelopmentalEditor(client, "DevEditor", "Developmental Editor", temperature=0.3, limiter=self.limiter)
+        self.fact_checker = FactChecker(client, "FactChecker", "Fact Checker", temperature=0.1, limiter=self.limiter)
+        self.copy_editor = CopyEditor(client, "CopyEditor", "Copy Editor", temperature=0.2, limiter=self.limiter)
+        self.assessment = AssessmentDesigner(client, "Assessment", "Assessment Designer", temperature=0.4, limiter=self.limiter)
+        
+        agents = (self.sme, self.dev_editor, self.fact_checker, self.copy_editor, self.assessment)
+        assert all(agent.client is client for agent in agents), "agents must share one client"
     
     def load_claims(self) -> Dict[str, Dict]:
         """Load evidence claims."""
         if self.claims_map:
             return self.claims_map
             
-        if CLAIMS_FILE.exists():
-            with open(CLAIMS_FILE, 'r', encoding='utf-8') as f:
-                for i, line in enumerate(f):
+        if CLAIMS_FILE.exists() and CLAIMS_FILE.stat().st_size:
+            # Lines come straight off the mapping; orjson parses bytes as-is
+            with open(CLAIMS_FILE, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for i, line in enumerate(iter(mm.readline, b"")):
                     try:
-                        data = json.loads(line)
-                        claim_id = f"claim_{i:05d}"
-                        data["claim_id"] = claim_id
-                        self.claims_map[claim_id] = data
-                    except:
-                        pass
+                        data = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    if not isinstance(data, dict):
+                        continue
+                    claim_id = f"claim_{i:05d}"
+                    data["claim_id"] = claim_id
+                    self.claims_map[claim_id] = data
+                    self.claims_text_lines[claim_id] = (
+                        f"- [{claim_id}] {data.get('text', '')} ({data.get('type', 'fact')})"
+                    )
         
         return self.claims_map
     
-    def get_evidence(self, claim_ids: List[str]) -> str:
-        """Format evidence for agents."""
-        evidence = []
-        for cid in claim_ids:
-            if cid in self.claims_map:
-                c = self.claims_map[cid]
-                evidence.append(f"- [{cid}] {c['text']} ({c.get('type', 'fact')})")
-        return "\n".join(evidence)
+    def get_evidence(self, claim_ids: List[str]) -> List[str]:
+        """Look up evidence lines for agents, keeping the planner's order."""
+        lines = self.claims_text_lines
+        return [lines[cid] for cid in claim_ids if cid in lines]
+    
+    def converged(self, round_num: int, score: float, prev_score: float) -> bool:
+        """Accept a draft the reviewer scores highly or that stopped improving."""
+        if round_num == 0:
+            return score >= AUTO_APPROVE_SCORE
+        return score - prev_score < CONVERGENCE_DELTA
     
-    def process_chapter(self, chapter_plan: Dict) -> ChapterHistory:
+    async def process_chapter(self, chapter_plan: Dict) -> ChapterHistory:
         """Run the complete publishing workflow for a chapter."""
         
         chapter_id = chapter_plan['chapter_id']
@@ -543,7 +697,7 @@ class SeniorEditor:
         print(f"{'='*70}")
         
         passes = []
-        total_start = time.time()
+        total_start = time.monotonic()
         revision_round = 0
         content = ""
         
@@ -553,8 +707,8 @@ class SeniorEditor:
         print("\n📝 PHASE 1: Initial Draft")
         print("   → Assigning to Subject Matter Expert...")
         
-        start = time.time()
-        content, sme_score = self.sme.write_draft(chapter_plan, evidence)
+        start = time.monotonic()
+        content, sme_score = await self.sme.write_draft(chapter_plan, evidence)
         
         passes.append(AgentPass(
             agent_name="SubjectMatterExpert",
@@ -564,44 +718,47 @@ class SeniorEditor:
             feedback_given=[],
             feedback_received=[],
             revision_round=0,
-            duration_seconds=time.time() - start
+            duration_seconds=time.monotonic() - start
         ))
         
-        print(f"   ✓ Draft complete ({len(content.split())} words, score: {sme_score:.0%})")
-        time.sleep(2)
+        print(f"   ✓ Draft complete (~{len(content) // AVG_WORD_CHARS} words, score: {sme_score:.0%})")
         
         # =========================================================
         # PHASE 2: Developmental Review (with possible revision loop)
         # =========================================================
         print("\n🎓 PHASE 2: Developmental Review")
         
+        prev_score = 0.0
         for round_num in range(MAX_REVISION_ROUNDS + 1):
             print(f"   → Round {round_num + 1}: Developmental Editor reviewing...")
             
-            start = time.time()
-            content, decision, feedback, ped_score = self.dev_editor.review(content, chapter_plan)
+            start = time.monotonic()
+            content, decision, feedback, ped_score = await self.dev_editor.review(content, chapter_plan)
             
             passes.append(AgentPass(
                 agent_name="DevelopmentalEditor",
                 role="Pedagogical Review",
                 content=content,
                 score=ped_score,
-                feedback_given=[feedback] if decision == ReviewDecision.REQUEST_REVISION else [],
+                feedback_given=[feedback] if decision == "request_revision" else [],
                 feedback_received=[],
                 revision_round=round_num,
-                duration_seconds=time.time() - start
+                duration_seconds=time.monotonic() - start
             ))
             
-            if decision == ReviewDecision.APPROVE:
+            if decision == "approve":
                 print(f"   ✓ Approved (pedagogy: {ped_score:.0%})")
                 break
-            elif round_num < MAX_REVISION_ROUNDS:
+            if self.converged(round_num, ped_score, prev_score):
+                print(f"   ✓ Converged, accepting (pedagogy: {ped_score:.0%})")
+                break
+            prev_score = ped_score
+            if round_num < MAX_REVISION_ROUNDS:
                 print(f"   ↺ Revision requested: {len(feedback.comments)} issues")
                 print("   → Sending back to SME...")
-                time.sleep(2)
                 
-                start = time.time()
-                content, sme_score = self.sme.write_draft(chapter_plan, evidence, [feedback])
+                start = time.monotonic()
+                content, sme_score = await self.sme.write_revision(chapter_plan, content, [feedback])
                 
                 passes.append(AgentPass(
                     agent_name="SubjectMatterExpert",
@@ -611,45 +768,48 @@ class SeniorEditor:
                     feedback_given=[],
                     feedback_received=[feedback],
                     revision_round=round_num + 1,
-                    duration_seconds=time.time() - start
+                    duration_seconds=time.monotonic() - start
                 ))
                 
                 print("   ✓ SME revised draft")
                 revision_round = round_num + 1
-            time.sleep(2)
         
         # =========================================================
         # PHASE 3: Fact Checking (with possible revision loop)
         # =========================================================
         print("\n🔍 PHASE 3: Fact Checking")
         
+        prev_score = 0.0
         for round_num in range(MAX_REVISION_ROUNDS + 1):
             print(f"   → Round {round_num + 1}: Fact Checker verifying...")
             
-            start = time.time()
-            content, decision, feedback, acc_score = self.fact_checker.verify(content, evidence)
+            start = time.monotonic()
+            content, decision, feedback, acc_score = await self.fact_checker.verify(content, evidence)
             
             passes.append(AgentPass(
                 agent_name="FactChecker",
                 role="Accuracy Verification",
                 content=content,
                 score=acc_score,
-                feedback_given=[feedback] if decision == ReviewDecision.REQUEST_REVISION else [],
+                feedback_given=[feedback] if decision == "request_revision" else [],
                 feedback_received=[],
                 revision_round=round_num,
-                duration_seconds=time.time() - start
+                duration_seconds=time.monotonic() - start
             ))
             
-            if decision == ReviewDecision.APPROVE:
+            if decision == "approve":
                 print(f"   ✓ Verified (accuracy: {acc_score:.0%})")
                 break
-            elif round_num < MAX_REVISION_ROUNDS:
+            if self.converged(round_num, acc_score, prev_score):
+                print(f"   ✓ Converged, accepting (accuracy: {acc_score:.0%})")
+                break
+            prev_score = acc_score
+            if round_num < MAX_REVISION_ROUNDS:
                 print(f"   ↺ Corrections needed: {len(feedback.specific_fixes)} major issues")
                 print("   → Sending back to SME...")
-                time.sleep(2)
                 
-                start = time.time()
-                content, sme_score = self.sme.write_draft(chapter_plan, evidence, [feedback])
+                start = time.monotonic()
+                content, sme_score = await self.sme.write_revision(chapter_plan, content, [feedback])
                 
                 passes.append(AgentPass(
                     agent_name="SubjectMatterExpert",
@@ -659,20 +819,37 @@ class SeniorEditor:
                     feedback_given=[],
                     feedback_received=[feedback],
                     revision_round=revision_round + round_num + 1,
-                    duration_seconds=time.time() - start
+                    duration_seconds=time.monotonic() - start
                 ))
                 
                 print("   ✓ SME corrected content")
-            time.sleep(2)
         
         # =========================================================
-        # PHASE 4: Copy Editing (polish, no revision loop)
+        # PHASE 4 + 5: Copy Editing and Assessment Creation
+        # Both only need the fact-checked draft, so they run together
         # =========================================================
         print("\n✏️  PHASE 4: Copy Editing")
         print("   → Copy Editor polishing...")
+        print("\n📋 PHASE 5: Assessment Creation")
+        
+        idx = content.find(QUESTIONS_HEADER)
+        drafted_questions = content[idx:] if idx != -1 else ""
+        drafted_count = drafted_questions.count(ANSWER_MARKER)
+        keep_drafted = drafted_count >= MIN_QUESTIONS
         
-        start = time.time()
-        content, lang_score = self.copy_editor.polish(content)
+        if keep_drafted:
+            # The draft already carries a full question set; keep it
+            print(f"   ↷ Draft already has {drafted_count} answered questions, skipping Assessment Designer")
+            (content, lang_score), polish_time = await timed(self.copy_editor.polish(content))
+            idx = content.find(QUESTIONS_HEADER)
+            questions = content[idx:] if idx != -1 else drafted_questions
+            assess_score = self.assessment.score_questions(questions)
+        else:
+            print("   → Assessment Designer creating questions...")
+            ((content, lang_score), polish_time), ((questions, assess_score), assess_time) = await asyncio.gather(
+                timed(self.copy_editor.polish(content)),
+                timed(self.assessment.create_assessment(content, title))
+            )
         
         passes.append(AgentPass(
             agent_name="CopyEditor",
@@ -682,44 +859,34 @@ class SeniorEditor:
             feedback_given=[],
             feedback_received=[],
             revision_round=0,
-            duration_seconds=time.time() - start
+            duration_seconds=polish_time
         ))
         
         print(f"   ✓ Polished (language: {lang_score:.0%})")
-        time.sleep(2)
-        
-        # =========================================================
-        # PHASE 5: Assessment Creation
-        # =========================================================
-        print("\n📋 PHASE 5: Assessment Creation")
-        print("   → Assessment Designer creating questions...")
-        
-        start = time.time()
-        questions, assess_score = self.assessment.create_assessment(content, title)
         
-        passes.append(AgentPass(
-            agent_name="AssessmentDesigner",
-            role="Question Creation",
-            content=questions,
-            score=assess_score,
-            feedback_given=[],
-            feedback_received=[],
-            revision_round=0,
-            duration_seconds=time.time() - start
-        ))
-        
-        print(f"   ✓ Questions created (quality: {assess_score:.0%})")
+        if not keep_drafted:
+            passes.append(AgentPass(
+                agent_name="AssessmentDesigner",
+                role="Question Creation",
+                content=questions,
+                score=assess_score,
+                feedback_given=[],
+                feedback_received=[],
+                revision_round=0,
+                duration_seconds=assess_time
+            ))
+            
+            print(f"   ✓ Questions created (quality: {assess_score:.0%})")
         
         # =========================================================
         # PHASE 6: Senior Editor Final Integration
         # =========================================================
         print("\n👔 PHASE 6: Senior Editor Final Review")
         
-        # Integrate questions into content
-        if "## שאלות לתרגול" in content:
-            # Replace existing questions section
-            import re
-            content = re.sub(r'## שאלות לתרגול.*', questions, content, flags=re.DOTALL)
+        # Integrate questions into content, replacing any existing section
+        idx = content.find(QUESTIONS_HEADER)
+        if idx != -1:
+            content = content[:idx] + questions
         else:
             content += "\n\n" + questions
         
@@ -733,7 +900,7 @@ class SeniorEditor:
             "overall": (sme_score + ped_score + acc_score + lang_score + assess_score) / 5
         }
         
-        total_duration = time.time() - total_start
+        total_duration = time.monotonic() - total_start
         
         print(f"\n{'─'*50}")
         print("   ✅ CHAPTER COMPLETE")
@@ -766,10 +933,25 @@ class PublishingPipeline:
     def __init__(self, api_key: str = None):
         self.api_key = api_key or API_KEY
         self.client = None
+        # Tags this run's lines in the append-only per-chapter pass logs
+        self.run_id = time.strftime("%Y%m%dT%H%M%S")
         self.senior_editor = None
         
         if GENAI_AVAILABLE and self.api_key:
-            self.client = genai.Client(api_key=self.api_key)
+            # One pooled HTTP/2 client is shared by every agent and chapter
+            self.client = genai.Client(
+                api_key=self.api_key,
+                http_options=types.HttpOptions(
+                    timeout=LLM_TIMEOUT_MS,
+                    httpx_async_client=httpx.AsyncClient(
+                        http2=HTTP2_AVAILABLE,
+                        limits=httpx.Limits(
+                            max_connections=MAX_CONNECTIONS,
+                            max_keepalive_connections=MAX_CONNECTIONS
+                        )
+                    )
+                )
+            )
             self.senior_editor = SeniorEditor(self.client)
             print("✅ Publishing Pipeline initialized")
             print("   Agents: SME, DevEditor, FactChecker, CopyEditor, AssessmentDesigner")
@@ -777,7 +959,7 @@ class PublishingPipeline:
         else:
             print("❌ Failed to initialize pipeline")
     
-    def run(self, chapter_ids: List[str] = None) -> List[ChapterHistory]:
+    async def run(self, chapter_ids: List[str] = None) -> List[ChapterHistory]:
         """Run the full publishing pipeline."""
         
         # Load data
@@ -793,54 +975,15 @@ class PublishingPipeline:
         print("📖 EDUCATIONAL PUBLISHING PIPELINE")
         print(f"   Chapters to process: {len(plans)}")
         print(f"   Max revision rounds: {MAX_REVISION_ROUNDS}")
+        print(f"   Concurrent chapters: {MAX_CONCURRENT_CHAPTERS}")
         print(f"{'='*70}")
         
-        results = []
         CHAPTERS_DIR.mkdir(parents=True, exist_ok=True)
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
         
-        for plan in plans:
-            try:
-                history = self.senior_editor.process_chapter(plan)
-                results.append(history)
-                
-                # Save chapter
-                filename = f"{plan['chapter_id']}_{plan['title'].replace(' ', '_').replace('/', '-')}.md"
-                output_path = CHAPTERS_DIR / filename
-                output_path.write_text(history.final_content, encoding='utf-8')
-                print(f"\n💾 Saved: {output_path.name}")
-                
-                # Save history log
-                log_path = LOGS_DIR / f"{plan['chapter_id']}_history.json"
-                with open(log_path, 'w', encoding='utf-8') as f:
-                    # Convert to serializable format
-                    log_data = {
-                        "chapter_id": history.chapter_id,
-                        "title": history.title,
-                        "total_revisions": history.total_revisions,
-                        "final_scores": history.final_scores,
-                        "total_duration": history.total_duration,
-                        "passes": [
-                            {
-                                "agent": p.agent_name,
-                                "role": p.role,
-                                "score": p.score,
-                                "revision_round": p.revision_round,
-                                "duration": p.duration_seconds
-                            }
-                            for p in history.passes
-                        ]
-                    }
-                    json.dump(log_data, f, ensure_ascii=False, indent=2)
-                
-                # Wait between chapters
-                print("⏳ Waiting 10s before next chapter...")
-                time.sleep(10)
-                
-            except Exception as e:
-                print(f"❌ Failed to process chapter {plan['chapter_id']}: {e}")
-                import traceback
-                traceback.print_exc()
+        sem = asyncio.Semaphore(MAX_CONCURRENT_CHAPTERS)
+        histories = await asyncio.gather(*(self.run_chapter(plan, sem) for plan in plans))
+        results = [h for h in histories if h is not None]
         
         # Final summary
         if results:
@@ -855,12 +998,59 @@ class PublishingPipeline:
             print(f"{'='*70}")
         
         return results
+    
+    async def run_chapter(self, plan: Dict, sem: asyncio.Semaphore) -> Optional[ChapterHistory]:
+        """Process and save one chapter while holding a concurrency slot."""
+        async with sem:
+            try:
+                history = await self.senior_editor.process_chapter(plan)
+                
+                # Save chapter and history log side by side, off the event loop
+                filename = f"{plan['chapter_id']}_{plan['title'].replace(' ', '_').replace('/', '-')}.md"
+                output_path = CHAPTERS_DIR / filename
+                await asyncio.gather(
+                    asyncio.to_thread(output_path.write_text, history.final_content, encoding='utf-8'),
+                    asyncio.to_thread(self.save_logs, history)
+                )
+                print(f"\n💾 Saved: {output_path.name}")
+                return history
+                
+            except Exception as e:
+                print(f"❌ Failed to process chapter {plan['chapter_id']}: {e}")
+                traceback.print_exc()
+                return None
+    
+    def save_logs(self, history: ChapterHistory):
+        """Write the chapter summary and append its passes to the JSONL log."""
+        log_data = {
+            "chapter_id": history.chapter_id,
+            "title": history.title,
+            "total_revisions": history.total_revisions,
+            "final_scores": history.final_scores,
+            "total_duration": history.total_duration,
+            "run_id": self.run_id,
+            "passes_log": f"{history.chapter_id}.jsonl",
+            "passes": [
+                {
+                    "agent": p.agent_name,
+                    "role": p.role,
+                    "score": p.score,
+                    "revision_round": p.revision_round,
+                    "duration": p.duration_seconds
+                }
+                for p in history.passes
+            ]
+        }
+        log_path = LOGS_DIR / f"{history.chapter_id}_history.json"
+        log_path.write_bytes(orjson.dumps(log_data, option=orjson.OPT_INDENT_2))
+        
+        # Append every pass, tagged with this run, to the chapter's JSONL log in one write
+        with open(LOGS_DIR / f"{history.chapter_id}.jsonl", 'ab') as f:
+            f.write(b"".join(orjson.dumps({"run_id": self.run_id, **asdict(p)}) + b"\n" for p in history.passes))
 
 
 def main():
     """Run the educational publishing pipeline."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Educational Publishing Pipeline")
     parser.add_argument("--chapters", nargs="*", help="Specific chapter IDs")
     parser.add_argument("--dry-run", action="store_true", help="Show plan only")
@@ -875,7 +1065,7 @@ def main():
         return
     
     pipeline = PublishingPipeline()
-    pipeline.run(chapter_ids=args.chapters)
+    asyncio.run(pipeline.run(chapter_ids=args.chapters))
 
 
 if __name__ == "__main__":
@@ -7,33 +7,41 @@ from collections import defaultdict
 
 # Hebrew letter order for sorting
 HEBREW_LETTERS = "אבגדהוזחטיכלמנסעפצקרשת"
+_HEBREW_SET = frozenset(HEBREW_LETTERS)
 
-def get_hebrew_sort_key(term):
-    """Get sorting key based on first Hebrew character"""
+# Hebrew letter names for headers
+_LETTER_NAMES = {
+    'א': 'א (Alef)', 'ב': 'ב (Bet)', 'ג': 'ג (Gimel)', 'ד': 'ד (Dalet)',
+    'ה': 'ה (Heh)', 'ו': 'ו (Vav)', 'ז': 'ז (Zayin)', 'ח': 'ח (Chet)',
+    'ט': 'ט (Tet)', 'י': 'י (Yod)', 'כ': 'כ (Kaf)', 'ל': 'ל (Lamed)',
+    'מ': 'מ (Mem)', 'נ': 'נ (Nun)', 'ס': 'ס (Samech)', 'ע': 'ע (Ayin)',
+    'פ': 'פ (Peh)', 'צ': 'צ (Tzadi)', 'ק': 'ק (Qof)', 'ר': 'ר (Resh)',
+    'ש': 'ש (Shin)', 'ת': 'ת (Tav)'
+}
+
+# Glossary table rows: | **hebrew** | english | definition |
+_GLOSSARY_ROW_RE = re.compile(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \|')
+
+def _first_hebrew(term):
+    """Return the Hebrew letter term starts with, or None if it starts with another letter"""
     for char in term:
-        if char in HEBREW_LETTERS:
-            return (0, HEBREW_LETTERS.index(char), term)
-    # Non-Hebrew terms go at the end
-    return (1, 0, term.lower())
+        if char in _HEBREW_SET:
+            return char
+        elif char.isalpha():
+            return None
+    return None
 
 def is_hebrew_term(term):
     """Check if term starts with a Hebrew letter"""
-    for char in term:
-        if char in HEBREW_LETTERS:
-            return True
-        elif char.isalpha():
-            return False
-    return False
+    return _first_hebrew(term) is not None
 
 def parse_existing_glossary(glossary_path):
     """Parse the existing markdown glossary table"""
     content = glossary_path.read_text(encoding='utf-8')
     
     # Find table rows (skip header and separator)
-    pattern = r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \|'
-    
     terms = []
-    for match in re.finditer(pattern, content):
+    for match in _GLOSSARY_ROW_RE.finditer(content):
         hebrew = match.group(1).strip()
         english = match.group(2).strip()
         definition = match.group(3).strip()
@@ -54,14 +62,9 @@ def group_by_first_letter(terms):
     english_terms = []
     
     for term in terms:
-        if is_hebrew_term(term['hebrew']):
-            first_letter = None
-            for char in term['hebrew']:
-                if char in HEBREW_LETTERS:
-                    first_letter = char
-                    break
-            if first_letter:
-                grouped[first_letter].append(term)
+        first_letter = _first_hebrew(term['hebrew'])
+        if first_letter:
+            grouped[first_letter].append(term)
         else:
             english_terms.append(term)
     
@@ -81,20 +84,10 @@ def generate_glossary_markdown(hebrew_grouped, english_terms):
     output.append("---")
     output.append("")
     
-    # Hebrew letter names for headers
-    letter_names = {
-        'א': 'א (Alef)', 'ב': 'ב (Bet)', 'ג': 'ג (Gimel)', 'ד': 'ד (Dalet)',
-        'ה': 'ה (Heh)', 'ו': 'ו (Vav)', 'ז': 'ז (Zayin)', 'ח': 'ח (Chet)',
-        'ט': 'ט (Tet)', 'י': 'י (Yod)', 'כ': 'כ (Kaf)', 'ל': 'ל (Lamed)',
-        'מ': 'מ (Mem)', 'נ': 'נ (Nun)', 'ס': 'ס (Samech)', 'ע': 'ע (Ayin)',
-        'פ': 'פ (Peh)', 'צ': 'צ (Tzadi)', 'ק': 'ק (Qof)', 'ר': 'ר (Resh)',
-        'ש': 'ש (Shin)', 'ת': 'ת (Tav)'
-    }
-    
     # Output Hebrew terms grouped by letter
     for letter in HEBREW_LETTERS:
         if letter in hebrew_grouped and hebrew_grouped[letter]:
-            header = letter_names.get(letter, letter)
+            header = _LETTER_NAMES.get(letter, letter)
             output.append(f"## {header}")
             output.append("")
             output.append("| מונח עברית | English | הגדרה |")
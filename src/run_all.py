@@ -1,36 +1,64 @@
 #!/usr/bin/env python3
+import atexit
 import os
 import sys
 import subprocess
 import time
 from pathlib import Path
 
+import orjson
+
 # Steps configuration
+# depends_on lists the steps whose outputs a step reads; steps whose
+# dependencies are all done run concurrently in the same wave.
 STEPS = [
-    {"name": "Step 2: Ingest", "script": "src/ingest.py", "args": []},
-    {"name": "Step 3: Extract", "script": "src/extract.py", "args": []},
-    {"name": "Step 4: Plan", "script": "src/plan.py", "args": []},
-    {"name": "Step 6: Write Chapters", "script": "src/write_book.py", "args": []},
-    {"name": "Step 8: Consistency", "script": "src/consistency.py", "args": []},
-    {"name": "Step 9: Extras", "script": "src/assemble_extras.py", "args": []},
-    {"name": "Step 7: Verify", "script": "src/verify.py", "args": []},
-    {"name": "Step 10: Build PDF", "script": "book/build_pdf.sh", "args": []},
+    {"name": "Step 2: Ingest", "script": "src/ingest.py", "args": [], "depends_on": []},
+    {"name": "Step 3: Extract", "script": "src/extract.py", "args": [], "depends_on": ["Step 2: Ingest"]},
+    {"name": "Step 4: Plan", "script": "src/plan.py", "args": [], "depends_on": ["Step 3: Extract"]},
+    {"name": "Step 6: Write Chapters", "script": "src/write_book.py", "args": [], "depends_on": ["Step 4: Plan"]},
+    {"name": "Step 8: Consistency", "script": "src/consistency.py", "args": [], "depends_on": ["Step 3: Extract"]},
+    {"name": "Step 9: Extras", "script": "src/assemble_extras.py", "args": [], "depends_on": ["Step 6: Write Chapters"]},
+    {"name": "Step 7: Verify", "script": "src/verify.py", "args": [], "depends_on": ["Step 6: Write Chapters"]},
+    {"name": "Step 10: Build PDF", "script": "book/build_pdf.sh", "args": [],
+     "depends_on": ["Step 6: Write Chapters", "Step 8: Consistency", "Step 9: Extras"]},
 ]
 
 LOG_FILE = Path("ops/logs/pipeline.jsonl")
 
+# Opened on the first event and kept for the whole run; unbuffered, so each
+# event reaches the file with a single write.
+_LOG_FH = None
+
 def log_event(event_type, details):
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        import json
-        f.write(json.dumps({
-            "timestamp": time.time(),
-            "type": event_type,
-            "details": details
-        }) + "\n")
+    global _LOG_FH
+    if _LOG_FH is None:
+        _LOG_FH = open(LOG_FILE, 'ab', buffering=0)
+        atexit.register(_LOG_FH.close)
+    _LOG_FH.write(orjson.dumps({
+        "timestamp": time.time(),
+        "type": event_type,
+        "details": details
+    }) + b"\n")
+
+def wavefronts(steps):
+    """Group steps into waves; each wave depends only on earlier waves.
+
+    Steps keep their STEPS order within a wave.
+    """
+    done = set()
+    remaining = list(steps)
+    waves = []
+    while remaining:
+        wave = [s for s in remaining if done.issuperset(s.get("depends_on", []))]
+        if not wave:
+            raise ValueError(f"Unsatisfiable step dependencies: {[s['name'] for s in remaining]}")
+        waves.append(wave)
+        done.update(s["name"] for s in wave)
+        remaining = [s for s in remaining if s["name"] not in done]
+    return waves
 
-def run_step(step):
+def start_step(step):
     print(f"\n[RUNNER] Starting {step['name']}...")
-    log_event("step_start", {"step": step['name']})
     
     start_time = time.time()
     
@@ -42,34 +70,32 @@ def run_step(step):
     elif step['script'].endswith('.sh'):
         cmd = ["bash", step['script']] + step['args']
         
-    try:
-        # Pass through environment variables
-        env = os.environ.copy()
-        
-        result = subprocess.run(
-            cmd,
-            env=env,
-            check=True,
-            text=True
-        )
-        
+    # Pass through environment variables
+    env = os.environ.copy()
+    
+    proc = subprocess.Popen(cmd, env=env, text=True)
+    log_event("step_start", {"step": step['name'], "pid": proc.pid})
+    return proc, start_time
+
+def finish_step(step, proc, start_time):
+    returncode = proc.wait()
+    if returncode == 0:
         duration = time.time() - start_time
         print(f"[RUNNER] Finished {step['name']} in {duration:.2f}s")
-        log_event("step_success", {"step": step['name'], "duration": duration})
+        log_event("step_success", {"step": step['name'], "pid": proc.pid, "duration": duration})
         return True
         
-    except subprocess.CalledProcessError as e:
-        print(f"[RUNNER] Step {step['name']} failed with code {e.returncode}")
-        log_event("step_failed", {"step": step['name'], "code": e.returncode})
-        # Determine if we should stop. For rigorous pipeline, yes.
-        # But extraction might be partial.
-        if step['name'] == "Step 3: Extract":
-            print("[RUNNER] Extraction might be partial or failed. Checking chunks...")
-            # We allow proceeding if some claims exist
-            if Path("ops/artifacts/claims.jsonl").exists():
-                 print("[RUNNER] Continuing with available claims.")
-                 return True
-        return False
+    print(f"[RUNNER] Step {step['name']} failed with code {returncode}")
+    log_event("step_failed", {"step": step['name'], "pid": proc.pid, "code": returncode})
+    # Determine if we should stop. For rigorous pipeline, yes.
+    # But extraction might be partial.
+    if step['name'] == "Step 3: Extract":
+        print("[RUNNER] Extraction might be partial or failed. Checking chunks...")
+        # We allow proceeding if some claims exist
+        if Path("ops/artifacts/claims.jsonl").exists():
+             print("[RUNNER] Continuing with available claims.")
+             return True
+    return False
 
 def main():
     print("=== Evidence-First Virology Ebook Pipeline ===")
@@ -81,9 +107,11 @@ def main():
     
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     
-    for step in STEPS:
-        success = run_step(step)
-        if not success:
+    for wave in wavefronts(STEPS):
+        # Launch the whole wave, then wait for every step in it
+        running = [(step, *start_step(step)) for step in wave]
+        results = [finish_step(step, proc, start_time) for step, proc, start_time in running]
+        if not all(results):
             print("[RUNNER] Pipeline halted due to failure.")
             sys.exit(1)
             
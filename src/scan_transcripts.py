@@ -1,23 +1,33 @@
 import os
-from pathlib import Path
+
+def scandir_txt(root):
+    """Yield .txt paths under root as strings, in sorted path order."""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from scandir_txt(entry.path)
+        elif entry.name.endswith('.txt') and entry.is_file():
+            yield entry.path
 
 def scan_directory(root_path):
     """
     Recursively scans the directory for .txt files.
     Returns a list of dictionaries containing filename, full path, and extracted metadata.
     """
-    root = Path(root_path)
     results = []
     
-    # Sort to ensure consistent order (though os.walk order isn't guaranteed, we sort after)
-    for path in sorted(root.rglob('*.txt')):
-        content = path.read_text(encoding='utf-8', errors='replace')
+    # Entries are sorted per directory, so the walk yields paths in sorted order
+    for path in scandir_txt(root_path):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            content = f.read()
         metadata = analyze_file_content(content)
+        parent, filename = os.path.split(path)
         
         results.append({
-            'filename': path.name,
-            'path': str(path),
-            'parent_dir': path.parent.name,
+            'filename': filename,
+            'path': path,
+            'parent_dir': os.path.basename(parent),
             'metadata': metadata
         })
         
@@ -1,11 +1,39 @@
 #!/usr/bin/env python3
 """Separate inline answers from questions in all chapters"""
 
+import contextlib
+import io
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-
-def separate_answers_in_chapter(chapter_path):
+# The practice-questions section body, up to the next header
+_QUESTIONS_RE = re.compile(r'##\s*שאלות לתרגול\s*\n(.*?)(?=##|\Z)', re.DOTALL)
+
+# Inline answer formats, tried in order until one matches:
+# Format 1: **תשובה:** ב
+# Format 2: תשובה: (ב)
+# Format 3: תשובה נכונה: (ב)
+# Format 4: תשובה: ב (no parentheses)
+_ANSWER_PATTERNS = [re.compile(p, re.DOTALL | re.MULTILINE) for p in (
+    r'(\d+)\.\s*(.*?)\*\*תשובה:\*\*\s*([א-ת]|[a-d])',       # Format 1
+    r'(\d+)\.\s*(.*?)תשובה:\s*\(([א-ת]|[a-d])\)',           # Format 2
+    r'(\d+)\.\s*(.*?)תשובה נכונה:\s*\(([א-ת]|[a-d])\)',    # Format 3
+    r'(\d+)\.\s*(.*?)תשובה:\s*([א-ת])\s*$',                 # Format 4 (Hebrew, end of line)
+    r'(\d+)\.\s*(.*?)תשובה:\s*([a-d])\s*$',                 # Format 4 (English, end of line)
+)]
+
+# Inline answers of every format, removed from the questions in one pass:
+# **תשובה:** ב, תשובה: (ב), תשובה נכונה: (ב), and תשובה: ב at end of line
+_STRIP_ANSWER_RE = re.compile(
+    r'\s*(?:\*\*תשובה:\*\*\s*[א-תa-d]'
+    r'|תשובה(?: נכונה)?:\s*\([א-תa-d]\)'
+    r'|תשובה:\s*[א-תa-d]\s*$)',
+    re.MULTILINE,
+)
+
+
+def separate_answers_in_chapter(chapter_path, content=None):
     """
     Transform questions from:
         1. Question text?
@@ -26,11 +54,11 @@ def separate_answers_in_chapter(chapter_path):
 
         1. **a** - [optional explanation]
     """
-    content = chapter_path.read_text(encoding='utf-8')
+    if content is None:
+        content = chapter_path.read_text(encoding='utf-8')
 
     # Find the questions section
-    questions_pattern = r'##\s*שאלות לתרגול\s*\n(.*?)(?=##|\Z)'
-    match = re.search(questions_pattern, content, re.DOTALL)
+    match = _QUESTIONS_RE.search(content)
 
     if not match:
         print(f"⚠️  No questions found in {chapter_path.name}")
@@ -38,23 +66,11 @@ def separate_answers_in_chapter(chapter_path):
 
     questions_section = match.group(1)
 
-    # Extract answers - handle multiple formats:
-    # Format 1: **תשובה:** ב
-    # Format 2: תשובה: (ב)
-    # Format 3: תשובה נכונה: (ב)
-    # Format 4: תשובה: ב (no parentheses)
-    answer_patterns = [
-        r'(\d+)\.\s*(.*?)\*\*תשובה:\*\*\s*([א-ת]|[a-d])',       # Format 1
-        r'(\d+)\.\s*(.*?)תשובה:\s*\(([א-ת]|[a-d])\)',           # Format 2
-        r'(\d+)\.\s*(.*?)תשובה נכונה:\s*\(([א-ת]|[a-d])\)',    # Format 3
-        r'(\d+)\.\s*(.*?)תשובה:\s*([א-ת])\s*$',                 # Format 4 (Hebrew, end of line)
-        r'(\d+)\.\s*(.*?)תשובה:\s*([a-d])\s*$',                 # Format 4 (English, end of line)
-    ]
-
+    # Extract answers - handle multiple formats
     answers = []
-    for pattern in answer_patterns:
+    for pattern in _ANSWER_PATTERNS:
         if not answers:  # Only try next pattern if no matches yet
-            for ans_match in re.finditer(pattern, questions_section, re.DOTALL | re.MULTILINE):
+            for ans_match in pattern.finditer(questions_section):
                 q_num = ans_match.group(1)
                 answer = ans_match.group(3)
                 answers.append(f"{q_num}. **{answer}**")
@@ -64,14 +80,7 @@ def separate_answers_in_chapter(chapter_path):
         return content
 
     # Remove inline answers - all formats
-    questions_clean = re.sub(r'\s*\*\*תשובה:\*\*\s*[א-ת]', '', questions_section)
-    questions_clean = re.sub(r'\s*\*\*תשובה:\*\*\s*[a-d]', '', questions_clean)
-    questions_clean = re.sub(r'\s*תשובה:\s*\([א-ת]\)', '', questions_clean)
-    questions_clean = re.sub(r'\s*תשובה:\s*\([a-d]\)', '', questions_clean)
-    questions_clean = re.sub(r'\s*תשובה נכונה:\s*\([א-ת]\)', '', questions_clean)
-    questions_clean = re.sub(r'\s*תשובה נכונה:\s*\([a-d]\)', '', questions_clean)
-    questions_clean = re.sub(r'\s*תשובה:\s*[א-ת]\s*$', '', questions_clean, flags=re.MULTILINE)
-    questions_clean = re.sub(r'\s*תשובה:\s*[a-d]\s*$', '', questions_clean, flags=re.MULTILINE)
+    questions_clean = _STRIP_ANSWER_RE.sub('', questions_section)
 
     # Reconstruct
     new_questions_section = f"""## שאלות לתרגול
@@ -90,16 +99,30 @@ def separate_answers_in_chapter(chapter_path):
 """
 
     # Replace in content
-    new_content = re.sub(
-        questions_pattern,
+    new_content = _QUESTIONS_RE.sub(
         f"## שאלות לתרגול\n{new_questions_section}",
-        content,
-        flags=re.DOTALL
+        content
     )
 
     return new_content
 
 
+def _process_one(chapter_file):
+    """Transform one chapter and write it back if it changed (runs in a worker).
+
+    Returns (name, changed, warnings), with any warnings the transform printed
+    captured so the parent can print them next to the chapter's own line.
+    """
+    original_content = chapter_file.read_text(encoding='utf-8')
+    with contextlib.redirect_stdout(io.StringIO()) as warnings:
+        new_content = separate_answers_in_chapter(chapter_file, original_content)
+
+    changed = new_content != original_content
+    if changed:
+        chapter_file.write_text(new_content, encoding='utf-8')
+    return chapter_file.name, changed, warnings.getvalue()
+
+
 if __name__ == "__main__":
     chapters_dir = Path("book/chapters")
 
@@ -119,14 +142,14 @@ if __name__ == "__main__":
     processed = 0
     skipped = 0
 
-    for chapter_file in chapter_files:
-        print(f"Processing {chapter_file.name}...", end=" ")
-
-        original_content = chapter_file.read_text(encoding='utf-8')
-        new_content = separate_answers_in_chapter(chapter_file)
+    # Workers transform chapters in parallel; all printing happens here, in chapter order
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(_process_one, chapter_files))
 
-        if new_content != original_content:
-            chapter_file.write_text(new_content, encoding='utf-8')
+    for name, changed, warnings in results:
+        print(f"Processing {name}...", end=" ")
+        print(warnings, end="")
+        if changed:
             print("✅ Updated")
             processed += 1
         else:
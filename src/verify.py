@@ -1,65 +1,82 @@
 #!/usr/bin/env python3
-import json
+import os
+import orjson
 from pathlib import Path
 
 CHAPTERS_DIR = Path("book/chapters")
 CLAIMS_FILE = Path("ops/artifacts/claims.jsonl")
 TRACEABILITY_FILE = Path("ops/artifacts/traceability.json")
 REPORT_FILE = Path("ops/reports/verification_report.md")
+COUNT_BLOCK_BYTES = 1 << 20
+
+def count_lines(path):
+    """Count lines by scanning raw blocks for newlines, without decoding."""
+    count = 0
+    last = b"\n"
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(COUNT_BLOCK_BYTES), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
 
 def main():
-    report = "# Verification Report\n\n"
+    output = ["# Verification Report", ""]
     
     # 1. Check Claims
     claim_count = 0
     if CLAIMS_FILE.exists():
-        with open(CLAIMS_FILE, 'r', encoding='utf-8') as f:
-            claim_count = sum(1 for _ in f)
-    report += f"- **Total Claims Extracted:** {claim_count}\n"
+        claim_count = count_lines(CLAIMS_FILE)
+    output.append(f"- **Total Claims Extracted:** {claim_count}")
     
     # 2. Check Traceability
     traceability = {}
     if TRACEABILITY_FILE.exists():
-        with open(TRACEABILITY_FILE, 'r', encoding='utf-8') as f:
-            traceability = json.load(f)
-    report += f"- **Chapters Generated:** {len(traceability)}\n\n"
+        traceability = orjson.loads(TRACEABILITY_FILE.read_bytes())
+    output.append(f"- **Chapters Generated:** {len(traceability)}")
+    output.append("")
     
     # 3. Chapter Analysis
-    report += "## Chapter Traceability\n\n"
-    chapters = sorted(list(CHAPTERS_DIR.glob("*.md")))
+    output.append("## Chapter Traceability")
+    output.append("")
+    chapters = []
+    if CHAPTERS_DIR.exists():
+        # DirEntry caches its stat result, so each chapter is stat'ed once
+        with os.scandir(CHAPTERS_DIR) as it:
+            chapters = sorted((e for e in it if e.name.endswith(".md")), key=lambda e: e.name)
     
     total_issues = 0
     
     for chap in chapters:
-        chap_id = chap.stem.split('_')[0]
-        report += f"### {chap.name}\n"
+        chap_id = chap.name.removesuffix(".md").split('_', 1)[0]
+        output.append(f"### {chap.name}")
         
         # Check size
         size = chap.stat().st_size
-        report += f"- Size: {size} bytes\n"
+        output.append(f"- Size: {size} bytes")
         
         # Check traceability entry
         if chap_id in traceability:
             claims_used = len(traceability[chap_id].get("claims_used", []))
-            report += f"- Claims Cited: {claims_used}\n"
+            output.append(f"- Claims Cited: {claims_used}")
             transcripts = len(traceability[chap_id].get("transcripts", []))
-            report += f"- Source Transcripts: {transcripts}\n"
+            output.append(f"- Source Transcripts: {transcripts}")
         else:
-            report += "- ⚠️ **No traceability record found.**\n"
+            output.append("- ⚠️ **No traceability record found.**")
             total_issues += 1
             
-        report += "\n"
+        output.append("")
         
-    report += "---\n"
+    output.append("---")
     if total_issues == 0 and len(chapters) > 0:
-        report += "**Status: ✅ VERIFIED**\n"
+        output.append("**Status: ✅ VERIFIED**")
     else:
-        report += f"**Status: ⚠️ ISSUES FOUND ({total_issues})**\n"
+        output.append(f"**Status: ⚠️ ISSUES FOUND ({total_issues})**")
         
     # Write report
     REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(REPORT_FILE, 'w', encoding='utf-8') as f:
-        f.write(report)
+        f.write('\n'.join(output) + '\n')
     print(f"Wrote verification report to {REPORT_FILE}")
 
 if __name__ == "__main__":
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 import os
-import json
+import orjson
 from pathlib import Path
 from google import genai
 from google.genai import types
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+# Sibling module: the script runs as python src/write_book.py
+import claims_cache
+
 load_dotenv()
 API_KEY = os.environ.get("GEMINI_API_KEY")
 
@@ -19,16 +22,8 @@ def load_claims():
     """Load all claims into a dictionary by claim_id."""
     claims = {}
     if CLAIMS_FILE.exists():
-        with open(CLAIMS_FILE, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f):
-                try:
-                    data = json.loads(line)
-                    # Assign ID consistent with plan.py
-                    claim_id = f"claim_{i:05d}"
-                    data["claim_id"] = claim_id
-                    claims[claim_id] = data
-                except:
-                    pass
+        for data in claims_cache.load(CLAIMS_FILE):
+            claims[data["claim_id"]] = data
     return claims
 
 def generate_chapter_content(client, chapter_plan, relevant_claims, model="gemini-2.0-flash"):
@@ -121,8 +116,7 @@ def main():
         
     client = genai.Client(api_key=API_KEY)
     
-    with open(CHAPTER_PLAN_FILE, 'r', encoding='utf-8') as f:
-        plans = json.load(f)
+    plans = orjson.loads(CHAPTER_PLAN_FILE.read_bytes())
         
     claims_map = load_claims()
     print(f"Loaded {len(claims_map)} claims.")
@@ -167,8 +161,7 @@ def main():
             print(f"Failed to write chapter {chap_id}: {e}")
             
     # Save traceability
-    with open(TRACEABILITY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(traceability, f, indent=2)
+    TRACEABILITY_FILE.write_bytes(orjson.dumps(traceability, option=orjson.OPT_INDENT_2))
         
     print("Book generation complete.")
 
@@ -12,8 +12,32 @@ Usage:
 import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+_SRC_CITATION_RE = re.compile(r'\s*\[SRC-\d{3}\]')
+_NEEDS_SOURCE_RE = re.compile(r'\s*<!-- \[NEEDS SOURCE\] -->')
+_MULTI_SPACE_RE = re.compile(r'  +')
+
+
+def _strip_file(filepath: Path):
+    """Strip citations from one chapter file; returns (name, characters stripped)."""
+    content = filepath.read_text(encoding='utf-8')
+    original_len = len(content)
+    
+    # Remove [SRC-XXX] citations
+    content = _SRC_CITATION_RE.sub('', content)
+    
+    # Remove [NEEDS SOURCE] markers
+    content = _NEEDS_SOURCE_RE.sub('', content)
+    
+    # Clean up double spaces
+    content = _MULTI_SPACE_RE.sub(' ', content)
+    
+    if len(content) != original_len:
+        filepath.write_text(content, encoding='utf-8')
+    return filepath.name, original_len - len(content)
+
 
 def strip_citations(book_dir: str):
     """Remove all citations from chapter files."""
@@ -25,24 +49,14 @@ def strip_citations(book_dir: str):
     
     total_stripped = 0
     
-    for filepath in chapters_dir.glob("*.md"):
-        content = filepath.read_text(encoding='utf-8')
-        original_len = len(content)
-        
-        # Remove [SRC-XXX] citations
-        content = re.sub(r'\s*\[SRC-\d{3}\]', '', content)
-        
-        # Remove [NEEDS SOURCE] markers
-        content = re.sub(r'\s*<!-- \[NEEDS SOURCE\] -->', '', content)
-        
-        # Clean up double spaces
-        content = re.sub(r'  +', ' ', content)
-        
-        if len(content) != original_len:
-            filepath.write_text(content, encoding='utf-8')
-            stripped = original_len - len(content)
+    # Files are independent, so spread the substitutions across cores
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(_strip_file, chapters_dir.glob("*.md")))
+    
+    for name, stripped in results:
+        if stripped:
             total_stripped += stripped
-            print(f"✓ {filepath.name}: stripped {stripped} characters")
+            print(f"✓ {name}: stripped {stripped} characters")
     
     print(f"\n✅ Total: {total_stripped} characters stripped from chapters")
     print("   Chapters are now ready for EPUB build.")
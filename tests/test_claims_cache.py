@@ -0,0 +1,23 @@
+import os
+from src import claims_cache
+
+def test_load_numbers_claims_by_line_and_skips_bad_lines(tmp_path):
+    jsonl = tmp_path / "claims.jsonl"
+    jsonl.write_bytes(b'{"text": "a"}\n\nnot json\n[1]\n{"text": "b"}\n')
+    claims = claims_cache.load(jsonl, tmp_path / "claims.pkl")
+    assert [(c["claim_id"], c["text"]) for c in claims] == [("claim_00000", "a"), ("claim_00004", "b")]
+
+def test_load_reuses_pickle_until_jsonl_changes(tmp_path):
+    jsonl = tmp_path / "claims.jsonl"
+    cache = tmp_path / "claims.pkl"
+    jsonl.write_bytes(b'{"text": "a"}\n')
+    claims_cache.load(jsonl, cache)
+    assert cache.exists()
+
+    # An older JSONL is served from the pickle, a newer one is re-parsed
+    jsonl.write_bytes(b'{"text": "b"}\n')
+    os.utime(jsonl, (0, 0))
+    assert claims_cache.load(jsonl, cache)[0]["text"] == "a"
+    os.utime(jsonl, None)
+    os.utime(cache, (0, 0))
+    assert claims_cache.load(jsonl, cache)[0]["text"] == "b"
@@ -24,3 +24,15 @@ def test_config_loading():
         assert cfg.USERNAME == "testuser"
         assert cfg.PASSWORD == "testpassword"
         assert cfg.COURSE_URL == "https://campus.gov.il/course/test"
+
+def test_config_is_frozen():
+    """Verify that settings are read once and cannot be reassigned."""
+    mock_env = {
+        "CAMPUS_IL_USERNAME": "testuser",
+        "CAMPUS_IL_PASSWORD": "testpassword",
+        "COURSE_URL": "https://campus.gov.il/course/test"
+    }
+    with patch.dict(os.environ, mock_env, clear=True):
+        cfg = Config(_env_file=None)
+    with pytest.raises(ValidationError):
+        cfg.COURSE_URL = "https://example.com"
@@ -1,6 +1,7 @@
+import asyncio
 import pytest
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from src.downloader import Downloader
 
 @pytest.fixture
@@ -19,16 +20,93 @@ def test_download_transcript_success(mocker):
     mock_frame = MagicMock()
     mock_page.frames = [mock_frame]
     
-    # Mock finding the link in the frame
-    mock_link = MagicMock()
-    mock_link.inner_text.return_value = "Download (.txt)"
-    mock_link.get_attribute.return_value = "https://example.com/transcript.txt"
-    mock_frame.query_selector_all.side_effect = lambda selector: [mock_link] if "a.btn" in selector else []
+    # Mock finding the link in the frame (one evaluate returns all candidates)
+    mock_frame.evaluate.return_value = [
+        {"tag": "A", "text": "Download (.txt)", "href": "https://example.com/transcript.txt"}
+    ]
     
     with patch.object(Downloader, '_download_file_from_url', return_value="Transcript content"):
         content = downloader.download_transcript("https://campus.gov.il/unit/1")
         assert content == "Transcript content"
-        mock_page.goto.assert_called_with("https://campus.gov.il/unit/1")
+        mock_page.goto.assert_called_with(
+            "https://campus.gov.il/unit/1", wait_until="domcontentloaded", timeout=15000
+        )
+
+def test_download_transcript_from_page_source():
+    """Verify that a transcript link in the raw HTML skips rendering the page."""
+    downloader = Downloader(username="user", password="pass")
+    downloader.page = MagicMock()
+    downloader.context = MagicMock()
+    page_html = '<a href="/assets/transcript_he.txt">Download</a>'
+
+    with patch.object(Downloader, '_http_get', return_value=page_html), \
+         patch.object(Downloader, '_download_file_from_url', return_value="Transcript content") as mock_dl:
+        content = downloader.download_transcript("https://campus.gov.il/unit/1")
+
+    assert content == "Transcript content"
+    mock_dl.assert_called_once_with("https://campus.gov.il/assets/transcript_he.txt")
+    downloader.page.goto.assert_not_called()
+
+def test_download_transcript_from_tab_source():
+    """Verify that tab HTML is scraped for a .txt link before any tab is clicked."""
+    downloader = Downloader(username="user", password="pass")
+    downloader.page = MagicMock()
+    downloader.page.frames = []
+    downloader.page.eval_on_selector_all.return_value = [
+        "https://campus.gov.il/unit/1/v1", "https://campus.gov.il/unit/1/v2"
+    ]
+    downloader.context = MagicMock()
+    sources = {
+        "https://campus.gov.il/unit/1": None,
+        "https://campus.gov.il/unit/1/v1": "<p>video</p>",
+        "https://campus.gov.il/unit/1/v2": '<a href="/static/lesson.txt">Text</a>',
+    }
+
+    with patch.object(Downloader, '_http_get', side_effect=sources.get), \
+         patch.object(Downloader, '_download_file_from_url', return_value="Transcript content") as mock_dl:
+        content = downloader.download_transcript("https://campus.gov.il/unit/1")
+
+    assert content == "Transcript content"
+    mock_dl.assert_called_once_with("https://campus.gov.il/static/lesson.txt")
+    downloader.page.query_selector_all.assert_not_called()
+
+def test_http_get_refreshes_cookies_on_401():
+    """Verify that a 401 rebuilds the HTTP client from fresh browser cookies."""
+    downloader = Downloader(username="user", password="pass")
+    downloader.context = MagicMock()
+    downloader.context.cookies.return_value = [
+        {"name": "sessionid", "value": "abc", "domain": "app.campus.gov.il", "path": "/"}
+    ]
+    stale = MagicMock()
+    stale.get.return_value.status_code = 401
+    fresh = MagicMock()
+    fresh.get.return_value.status_code = 200
+    fresh.get.return_value.text = "Transcript content"
+
+    with patch("src.downloader.httpx.Client", side_effect=[stale, fresh]):
+        assert downloader._http_get("https://campus.gov.il/t.txt") == "Transcript content"
+
+    stale.close.assert_called_once()
+    assert downloader.context.cookies.call_count == 2
+
+def test_http_error_falls_back_to_browser(mocker):
+    """Verify that a timeout on the early HTTP fetch does not escape download_transcript."""
+    import httpx
+    downloader = Downloader(username="user", password="pass")
+    downloader.page = MagicMock()
+    downloader.page.frames = []
+    downloader.page.query_selector_all.return_value = []
+    downloader.page.eval_on_selector_all.return_value = []
+    downloader.context = MagicMock()
+    downloader.context.cookies.return_value = []
+    client = MagicMock()
+    client.get.side_effect = httpx.ConnectTimeout("timed out")
+    mocker.patch.object(Downloader, "_fetch_transcript_url", return_value="https://campus.gov.il/t.txt")
+
+    with patch("src.downloader.httpx.Client", return_value=client):
+        assert downloader.download_transcript("https://campus.gov.il/unit/1") is None
+
+    downloader.page.goto.assert_called_once()
 
 def test_download_transcript_not_found(mocker):
     """Verify handling when no transcript link is found."""
@@ -53,6 +131,16 @@ def test_save_transcript(temp_output_dir):
     with open(file_path, "r", encoding="utf-8") as f:
         assert f.read() == content
 
+def test_save_transcript_async(temp_output_dir):
+    """Verify that the async writer creates the folder and saves the content."""
+    downloader = Downloader(username="user", password="pass")
+    folder = os.path.join(temp_output_dir, "01_Module")
+
+    file_path = asyncio.run(downloader.save_transcript_async("שלום", folder, "01_Test.txt"))
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert f.read() == "שלום"
+
 def test_bulk_download_skip_existing(temp_output_dir, mocker):
     """Verify that existing files are skipped during bulk download."""
     downloader = Downloader(username="user", password="pass")
@@ -79,3 +167,92 @@ def test_bulk_download_skip_existing(temp_output_dir, mocker):
     
     # Should NOT have called download_transcript
     mock_download.assert_not_called()
+
+def test_bulk_download_async(temp_output_dir, mocker):
+    """Verify that the concurrent path downloads missing units and skips existing ones."""
+    downloader = Downloader(username="user", password="pass")
+    hierarchy = [
+        {
+            "index": 1,
+            "title": "Module 1",
+            "path": temp_output_dir,
+            "units": [
+                {"index": 1, "title": "Unit 1", "url": "url1", "filename": "01_Unit_1.txt"},
+                {"index": 2, "title": "Unit 2", "url": "url2", "filename": "02_Unit_2.txt"},
+                {"index": 3, "title": "Unit 3", "url": "url3", "filename": "03_Unit_3.txt"}
+            ]
+        }
+    ]
+    with open(os.path.join(temp_output_dir, "01_Unit_1.txt"), "w") as f:
+        f.write("existing content")
+
+    mock_p = MagicMock()
+    mock_browser = AsyncMock()
+    mock_context = AsyncMock()
+    mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
+    mock_browser.new_context.return_value = mock_context
+    mock_playwright_cm = MagicMock()
+    mock_playwright_cm.__aenter__ = AsyncMock(return_value=mock_p)
+    mock_playwright_cm.__aexit__ = AsyncMock(return_value=False)
+    mocker.patch("playwright.async_api.async_playwright", return_value=mock_playwright_cm)
+    mocker.patch.object(
+        Downloader, "download_transcript_async",
+        side_effect=lambda page, url: "content" if url == "url2" else None
+    )
+
+    results = asyncio.run(downloader.bulk_download_async(hierarchy, temp_output_dir))
+
+    assert [u["title"] for u in results["skipped"]] == ["Unit 1"]
+    assert [u["title"] for u in results["downloaded"]] == ["Unit 2"]
+    assert [u["title"] for u in results["failed"]] == ["Unit 3"]
+    # One isolated context per downloaded unit, all on the same browser
+    mock_p.chromium.launch.assert_awaited_once()
+    assert mock_browser.new_context.await_count == 2
+    assert mock_context.close.await_count == 2
+    with open(os.path.join(temp_output_dir, "02_Unit_2.txt"), encoding="utf-8") as f:
+        assert f.read() == "content"
+
+def test_bulk_download_concurrent_from_sync_session(temp_output_dir, mocker):
+    """Verify that the concurrent path works while a sync Playwright session is running."""
+    from playwright.sync_api import sync_playwright
+
+    downloader = Downloader(username="user", password="pass")
+    downloader.context = MagicMock()
+    downloader.context.storage_state.return_value = {"cookies": []}
+    results = {"downloaded": [], "skipped": [], "failed": []}
+    mock_async = mocker.patch.object(Downloader, "bulk_download_async", new=AsyncMock(return_value=results))
+
+    # The sync API keeps an event loop running on this thread until stopped
+    playwright = sync_playwright().start()
+    try:
+        assert downloader.bulk_download([], temp_output_dir, concurrency=2) == results
+    finally:
+        playwright.stop()
+
+    mock_async.assert_awaited_once_with([], temp_output_dir, max_concurrency=2, storage_state={"cookies": []})
+
+def test_download_transcript_async_from_frame_link():
+    """Verify that the async path resolves a relative frame link through the page's request context."""
+    downloader = Downloader(username="user", password="pass")
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    frame = MagicMock()
+    frame.url = "https://campus.gov.il/xblock/1"
+    frame.evaluate = AsyncMock(return_value=[
+        {"tag": "A", "text": "Download (.txt)", "href": "/static/lesson.txt"}
+    ])
+    page.frames = [frame]
+
+    async def get(url):
+        response = MagicMock()
+        response.status = 200
+        # The unit HTML has no transcript link; the transcript itself is plain text
+        response.text = AsyncMock(return_value="Transcript content" if url.endswith(".txt") else "<html></html>")
+        return response
+    page.request.get = AsyncMock(side_effect=get)
+
+    content = asyncio.run(downloader.download_transcript_async(page, "https://campus.gov.il/unit/1"))
+
+    assert content == "Transcript content"
+    page.request.get.assert_awaited_with("https://campus.gov.il/static/lesson.txt")
@@ -5,7 +5,7 @@ from src.downloader import Downloader
 @pytest.fixture
 def mock_playwright_all(mocker):
     # Mock sync_playwright
-    mock_p_factory = mocker.patch("src.downloader.sync_playwright")
+    mock_p_factory = mocker.patch("playwright.sync_api.sync_playwright")
     mock_p_instance = MagicMock()
     mock_p_factory.return_value.start.return_value = mock_p_instance
     
@@ -42,10 +42,39 @@ def test_start_stop(mock_playwright_all):
     assert downloader.browser is not None
     assert downloader.page is not None
     
+    launch_args = mock_playwright_all["p"].chromium.launch.call_args.kwargs["args"]
+    assert "--disable-background-networking" in launch_args
+    
     downloader.stop()
     mock_playwright_all["browser"].close.assert_called_once()
     mock_playwright_all["p"].stop.assert_called_once()
 
+def test_start_blocks_non_essential_requests(mock_playwright_all):
+    """Verify that images/analytics are aborted and documents continue."""
+    downloader = Downloader(username="user", password="pass")
+    downloader.start()
+    pattern, handler = mock_playwright_all["context"].route.call_args.args
+    assert pattern == "**/*"
+
+    image = MagicMock()
+    image.request.resource_type = "image"
+    image.request.url = "https://app.campus.gov.il/logo.png"
+    handler(image)
+    image.abort.assert_called_once()
+
+    tracker = MagicMock()
+    tracker.request.resource_type = "script"
+    tracker.request.url = "https://www.google-analytics.com/analytics.js"
+    handler(tracker)
+    tracker.abort.assert_called_once()
+
+    document = MagicMock()
+    document.request.resource_type = "document"
+    document.request.url = "https://app.campus.gov.il/learning/course/x"
+    handler(document)
+    document.continue_.assert_called_once()
+    document.abort.assert_not_called()
+
 def test_stop_no_browser():
     """Verify stop doesn't crash if browser was never started."""
     downloader = Downloader(username="user", password="pass")
@@ -93,3 +122,21 @@ def test_is_logged_in_no_page():
     """Verify is_logged_in returns False when page is None."""
     downloader = Downloader(username="user", password="pass")
     assert downloader.is_logged_in() is False
+
+def test_pooled_start_stop(mock_playwright_all):
+    """Verify a pooled downloader borrows a browser and only closes its context."""
+    from src.downloader import BrowserPool
+    pool = BrowserPool(size=1)
+
+    with Downloader(username="user", password="pass", pool=pool) as downloader:
+        downloader.start()
+        assert downloader.browser is mock_playwright_all["browser"]
+        assert pool._q.empty()
+
+    mock_playwright_all["context"].close.assert_called_once()
+    mock_playwright_all["browser"].close.assert_not_called()
+    assert pool.acquire() is mock_playwright_all["browser"]
+
+    pool.close()
+    mock_playwright_all["browser"].close.assert_called_once()
+    mock_playwright_all["p"].stop.assert_called_once()
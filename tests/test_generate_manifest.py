@@ -18,6 +18,17 @@ def test_generate_book_manifest_structure(tmp_path):
     assert len(chap1['sources']) == 1
     assert chap1['sources'][0]['filename'] == '01_intro.txt'
 
+def test_generate_book_manifest_prefixed_directory():
+    scan_data = [
+        {'filename': '01_a.txt', 'parent_dir': '10_שיעור_7_חיסונים', 'path': 'p/01_a.txt'},
+        {'filename': '01_b.txt', 'parent_dir': '99_אחר', 'path': 'p/01_b.txt'}
+    ]
+    
+    manifest = generate_book_manifest(scan_data)
+    
+    assert [c['id'] for c in manifest['chapters']] == ['07']
+    assert manifest['chapters'][0]['directory'] == '10_שיעור_7_חיסונים'
+
 def test_generate_manifest_file_creation(tmp_path):
     # Test writing to file
     book_dir = tmp_path / "book"
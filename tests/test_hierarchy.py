@@ -39,6 +39,55 @@ def test_extract_hierarchy_mock(mocker):
         assert hierarchy[0]["title"] == "Introduction"
         assert len(hierarchy[0]["units"]) == 2
 
+def test_get_course_hierarchy_single_evaluate():
+    """Verify that the outline is read with one page.evaluate call."""
+    downloader = Downloader(username="user", password="pass")
+    downloader.page = MagicMock()
+    downloader.page.evaluate.return_value = [
+        {"title": "Introduction", "units": [{"index": 1, "title": "Welcome", "url": "https://x/u1"}]},
+        {"title": None, "units": []},
+        {"title": "Week 1", "units": []}
+    ]
+
+    with patch("src.downloader.config") as mock_config:
+        mock_config.COURSE_URL = "https://app.campus.gov.il/learning/course/x/home"
+        hierarchy = downloader.get_course_hierarchy()
+
+    downloader.page.evaluate.assert_called_once()
+    downloader.page.query_selector_all.assert_not_called()
+    assert [m["index"] for m in hierarchy] == [1, 3]
+    assert hierarchy[0]["units"][0]["url"] == "https://x/u1"
+
+def test_get_course_hierarchy_from_outline_api():
+    """Verify that the outline API is used when available, without loading the page."""
+    downloader = Downloader(username="user", password="pass")
+    downloader.page = MagicMock()
+    response = downloader.page.request.get.return_value
+    response.status = 200
+    response.json.return_value = {"course_blocks": {"blocks": {
+        "root": {"type": "course", "display_name": "Course", "children": ["ch1"]},
+        "ch1": {"type": "chapter", "display_name": " Intro ", "children": ["seq1", "seq2"]},
+        "seq1": {"type": "sequential", "display_name": "Welcome"},
+        "seq2": {"type": "sequential", "display_name": "Overview"}
+    }}}
+
+    with patch("src.downloader.config") as mock_config:
+        mock_config.COURSE_URL = "https://app.campus.gov.il/learning/course/course-v1:X+Y+2022/home"
+        hierarchy = downloader.get_course_hierarchy()
+
+    downloader.page.request.get.assert_called_once_with(
+        "https://app.campus.gov.il/api/course_home/outline/course-v1:X+Y+2022"
+    )
+    downloader.page.goto.assert_not_called()
+    assert hierarchy == [{
+        "index": 1,
+        "title": "Intro",
+        "units": [
+            {"index": 1, "title": "Welcome", "url": "https://app.campus.gov.il/learning/course/course-v1:X+Y+2022/seq1"},
+            {"index": 2, "title": "Overview", "url": "https://app.campus.gov.il/learning/course/course-v1:X+Y+2022/seq2"}
+        ]
+    }]
+
 def test_create_directories(temp_output_dir):
     """Verify that directories are created correctly based on hierarchy."""
     downloader = Downloader(username="user", password="pass")
@@ -57,9 +106,14 @@ def test_create_directories(temp_output_dir):
     expected_path = os.path.join(temp_output_dir, "01_Module_One")
     assert os.path.exists(expected_path)
     assert os.path.isdir(expected_path)
+    assert hierarchy[0]["path"] == expected_path
+    assert hierarchy[0]["units"][0]["filename"] == "01_Unit_A.txt"
 
 def test_sanitize_filename():
     """Verify filename sanitization."""
     downloader = Downloader(username="user", password="pass")
     assert downloader.sanitize_filename("Hello: World?") == "Hello_World"
     assert downloader.sanitize_filename("Module 1/2") == "Module_1_2"
+    assert downloader.sanitize_filename('a <b> | "c"') == "a_b_c"
+    assert downloader.sanitize_filename("__x__ _y") == "x_y"
+    assert downloader.sanitize_filename("Line\none\ttab") == "Line\none\ttab"
@@ -0,0 +1,51 @@
+import os
+import sys
+import orjson
+import pytest
+import src.ingest as ingest
+
+@pytest.fixture
+def ingest_dirs(tmp_path, monkeypatch):
+    transcripts = tmp_path / "transcripts"
+    transcripts.mkdir()
+    (transcripts / "01_intro.txt").write_text("Viruses  are\nsmall.", encoding="utf-8")
+    (transcripts / "02_dna.txt").write_text("DNA replicates.", encoding="utf-8")
+    output = tmp_path / "artifacts" / "chunks.jsonl"
+    monkeypatch.setattr(ingest, "TRANSCRIPT_DIR", transcripts)
+    monkeypatch.setattr(ingest, "OUTPUT_FILE", output)
+    monkeypatch.setattr(sys, "argv", ["ingest.py"])
+    return transcripts, output
+
+def chunk_ids(output):
+    return [orjson.loads(line)["chunk_id"] for line in output.read_bytes().splitlines()]
+
+def test_resume_skips_ingested_files(ingest_dirs):
+    transcripts, output = ingest_dirs
+    ingest.main()
+    (transcripts / "03_rna.txt").write_text("RNA.", encoding="utf-8")
+    ingest.main()
+    assert chunk_ids(output) == ["01_intro_0001", "02_dna_0001", "03_rna_0001"]
+
+def test_missing_output_starts_fresh(ingest_dirs):
+    transcripts, output = ingest_dirs
+    ingest.main()
+    output.unlink()
+    ingest.main()
+    assert chunk_ids(output) == ["01_intro_0001", "02_dna_0001"]
+
+def test_edited_transcript_is_rechunked(ingest_dirs):
+    transcripts, output = ingest_dirs
+    ingest.main()
+    edited = transcripts / "02_dna.txt"
+    edited.write_text("DNA replicates semi-conservatively.", encoding="utf-8")
+    os.utime(edited, ns=(0, 0))
+    ingest.main()
+    texts = [orjson.loads(line)["text"] for line in output.read_bytes().splitlines()]
+    assert texts == ["Viruses are small.", "DNA replicates semi-conservatively."]
+
+def test_original_length_counts_crlf_as_one_character(tmp_path):
+    path = tmp_path / "01_crlf.txt"
+    path.write_bytes("שלום\r\nworld\r\n".encode("utf-8"))
+    count, blob = ingest.process_file(path)
+    assert count == 1
+    assert orjson.loads(blob.splitlines()[0])["original_length"] == len("שלום\nworld\n")
@@ -0,0 +1,19 @@
+from src.multi_agent_writer import BaseAgent
+
+DEFAULT = {"decision": "approve", "issues": []}
+
+def make_agent():
+    return BaseAgent.__new__(BaseAgent)
+
+def test_parse_json_response_ignores_surrounding_prose():
+    response = 'Here is my review:\n{"decision": "revise", "issues": []}\nThanks!'
+    assert make_agent().parse_json_response(response, DEFAULT) == {"decision": "revise", "issues": []}
+
+def test_parse_json_response_malformed_object_returns_default():
+    # Trailing comma: must not fall back to the nested issue object
+    response = '{"decision": "revise", "issues": [{"type": "structure", "description": "d", "severity": "major"},]}'
+    assert make_agent().parse_json_response(response, DEFAULT) is DEFAULT
+
+def test_parse_json_response_truncated_reply_returns_default():
+    response = '{"decision": "revise", "issues": [{"type": "structure"}'
+    assert make_agent().parse_json_response(response, DEFAULT) is DEFAULT
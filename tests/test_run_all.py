@@ -0,0 +1,21 @@
+import pytest
+from src.run_all import STEPS, wavefronts
+
+def test_wavefronts_groups_independent_steps():
+    names = [[s["name"] for s in wave] for wave in wavefronts(STEPS)]
+    assert names == [
+        ["Step 2: Ingest"],
+        ["Step 3: Extract"],
+        ["Step 4: Plan", "Step 8: Consistency"],
+        ["Step 6: Write Chapters"],
+        ["Step 9: Extras", "Step 7: Verify"],
+        ["Step 10: Build PDF"],
+    ]
+
+def test_wavefronts_rejects_unsatisfiable_dependencies():
+    steps = [
+        {"name": "a", "depends_on": ["b"]},
+        {"name": "b", "depends_on": ["a"]},
+    ]
+    with pytest.raises(ValueError):
+        wavefronts(steps)
@@ -37,3 +37,15 @@ def test_analyze_file_content_extracts_basics():
     assert 'summary' in metadata
     # For now, we expect a simple extraction or just the content being processed
     assert "Cells" in metadata['summary'] or "Introduction" in metadata['summary']
+
+def test_scan_directory_returns_sorted_paths_and_skips_other_files(mock_transcripts_dir):
+    (mock_transcripts_dir / "03_שיעור_1" / "notes.md").write_text("not a transcript")
+    nested = mock_transcripts_dir / "04_שיעור_2" / "extra"
+    nested.mkdir()
+    (nested / "00_appendix.txt").write_text("Appendix.")
+    
+    results = scan_directory(mock_transcripts_dir)
+    
+    paths = [r['path'] for r in results]
+    assert paths == [str(p) for p in sorted(Path(mock_transcripts_dir).rglob('*.txt'))]
+    assert results[-1]['parent_dir'] == "extra"
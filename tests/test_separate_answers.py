@@ -0,0 +1,13 @@
+from pathlib import Path
+from separate_answers import separate_answers_in_chapter
+
+def test_answer_between_question_lines_keeps_paragraph_break():
+    content = "## שאלות לתרגול\n1. Q1?\nב) y\n**תשובה:** [א]\n2. Q2?\n"
+    result = separate_answers_in_chapter(Path("01_test.md"), content)
+    assert result.startswith("## שאלות לתרגול\n1. Q1?\nב) y\n\n2. Q2?\n\n---\n")
+    assert result.endswith("## מפתח תשובות\n\n1. **א**\n\n")
+
+def test_blank_lines_around_removed_answer_collapse():
+    content = "## שאלות לתרגול\n1. Q1?\n\n**תשובה:** [ב]\n*(הסבר)*\n\n\n2. Q2?\n**תשובה:** [c]"
+    result = separate_answers_in_chapter(Path("01_test.md"), content)
+    assert result.startswith("## שאלות לתרגול\n1. Q1?\n\n2. Q2?\n\n---\n")